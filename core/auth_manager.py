@@ -92,8 +92,11 @@ class AuthenticationManager:
                 'tokens': [token.to_dict() for token in self.tokens.values()],
                 'rate_limits': self.rate_limits
             }
-            with open(self.config_file, 'w') as f:
+            # Write aside then rename - a crash or concurrent load never sees truncated JSON
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'w') as f:
                 json.dump(config, f, indent=2)
+            os.replace(tmp_file, self.config_file)
             print(f"✅ Auth config saved to {self.config_file}")
         except Exception as e:
             print(f"❌ Could not save auth config: {e}")
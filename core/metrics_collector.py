@@ -9,6 +9,8 @@ import psutil
 from typing import Dict, Union, Optional
 import threading
 
+from .ros2_manager import dir_size_bytes
+
 
 class MetricsCollector:
     """Collects metrics during bag recording with OPTIMIZED adaptive performance"""
@@ -85,17 +87,7 @@ class MetricsCollector:
             
             if bag_path and os.path.exists(bag_path):
                 # Calculate current size
-                current_size = 0
-                try:
-                    for dirpath, dirnames, filenames in os.walk(bag_path):
-                        for filename in filenames:
-                            filepath = os.path.join(dirpath, filename)
-                            try:
-                                current_size += os.path.getsize(filepath)
-                            except:
-                                pass
-                except:
-                    pass
+                current_size = dir_size_bytes(bag_path)
                         
                 current_size_mb = current_size / (1024 * 1024)
                 self.metrics['size_mb'] = current_size_mb
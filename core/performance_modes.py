@@ -5,6 +5,7 @@ Automatically adjusts settings based on system specifications
 
 import psutil
 import platform
+import time
 from enum import Enum
 from typing import Dict, Any, Optional
 from PyQt5.QtCore import QObject, pyqtSignal  # type: ignore
@@ -30,10 +31,18 @@ class PerformanceModeManager(QObject):
         
         # Detect system specs
         self.system_info = self._detect_system_specs()
+        self._system_info_time = time.monotonic()
         
         # Auto-detect optimal mode
         self._current_mode = self._auto_detect_mode()
         
+    def refresh_system_specs(self, max_age: float = 5.0) -> Dict[str, Any]:
+        """Re-detect system specs unless the last detection is newer than max_age seconds"""
+        if time.monotonic() - self._system_info_time >= max_age:
+            self.system_info = self._detect_system_specs()
+            self._system_info_time = time.monotonic()
+        return self.system_info
+    
     def _detect_system_specs(self) -> Dict[str, Any]:
         """Detect system hardware specifications"""
         try:
@@ -49,7 +58,6 @@ class PerformanceModeManager(QObject):
             # Check if SSD (heuristic: very fast disk)
             try:
                 disk_io_start = psutil.disk_io_counters()
-                import time
                 time.sleep(0.1)
                 disk_io_end = psutil.disk_io_counters()
                 if disk_io_start and disk_io_end:
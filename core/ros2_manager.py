@@ -14,6 +14,9 @@ from typing import Optional, Dict, Any
 from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import queue
 
+# ⚡ libyaml C loader for metadata.yaml (3-10x faster), pure-Python fallback
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 # Import ML exporter (lightweight packaging)
 try:
     from .ml_exporter import package_bag_for_ml, populate_schema_with_bag_info
@@ -46,6 +49,27 @@ except Exception:
     RecordingMonitor = None
 
 
+def dir_size_bytes(path):
+    """Total size of all files under path - os.scandir crawl (d_type cached, no per-file stat of dirs)"""
+    total = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass  # File vanished mid-scan (e.g. bag split rotation)
+        except OSError:
+            pass
+    return total
+
+
 class ROS2Manager:
     """Manages ROS2 bag recording and topic information - AGGRESSIVE OPTIMIZATION"""
     
@@ -66,6 +90,10 @@ class ROS2Manager:
         self._cache_timestamps = {}
         self._cache_lock = threading.Lock()
         
+        # Parsed bag info keyed by path -> ((mtime_ns, size) of metadata.yaml, info)
+        self._bag_info_cache = {}
+        self._bag_info_cache_max = 256
+        
         # Pre-cache frequently requested data
         self._last_topics_list = []
         self._last_nodes_list = []
@@ -167,57 +195,28 @@ class ROS2Manager:
         try:
             # Get list of topics with dynamic timeout based on performance mode
             result = subprocess.run(
-                ['ros2', 'topic', 'list'],
+                ['ros2', 'topic', 'list', '-t'],
                 capture_output=True,
                 text=True,
                 timeout=self._subprocess_timeout  # Dynamic timeout based on performance mode
             )
             
             if result.returncode == 0:
-                topic_names = [t.strip() for t in result.stdout.strip().split('\n') if t.strip()]
+                # ⚡ "-t" prints "/name [pkg/msg/Type]": one CLI process (one rclpy import and
+                # graph discovery) instead of an extra `ros2 topic type` process per topic
+                topic_names = []
+                topic_types = {}
+                for line in result.stdout.splitlines():
+                    name, _, type_part = line.strip().partition(' ')
+                    if name:
+                        topic_names.append(name)
+                        topic_types[name] = type_part.strip('[] ') or "Unknown"
                 
-                # Get info for all topics - use ThreadPoolExecutor to fetch types in parallel
                 topics = []
                 
-                # Fetch types in parallel with reduced timeout per topic
                 if topic_names:
-                    # Use thread pool to get types concurrently
-                    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
-                    
-                    with ThreadPoolExecutor(max_workers=8) as executor:
-                        # Submit all type fetches
-                        future_to_topic = {
-                            executor.submit(self._get_topic_type, t): t 
-                            for t in topic_names
-                        }
-                        
-                        # Collect results with graceful timeout handling
-                        topic_types = {}
-                        remaining_futures = set(future_to_topic.keys())
-                        timeout_per_batch = 3.0  # CRITICAL FIX: Reduce from 45s to 3s (prevents UI freeze)
-                        start_time = time.time()
-                        
-                        while remaining_futures and (time.time() - start_time) < timeout_per_batch:
-                            try:
-                                done, remaining_futures = wait(
-                                    remaining_futures,
-                                    timeout=0.5,  # CRITICAL FIX: Reduce from 2.0s to 0.5s
-                                    return_when=FIRST_COMPLETED
-                                )
-                                
-                                # Process completed futures
-                                for future in done:
-                                    topic_name = future_to_topic[future]
-                                    try:
-                                        msg_type = future.result(timeout=0.1)
-                                        topic_types[topic_name] = msg_type
-                                    except Exception:
-                                        topic_types[topic_name] = "Unknown"
-                            except Exception:
-                                # If anything goes wrong, just process what we have
-                                break
-                    
-                    # Build topic list with types
+                    # Build topic list with types - every key is always present (the topic
+                    # table reads rows positionally, without .get() defaults)
                     for t in topic_names:
                         topics.append({
                             'name': t, 
@@ -262,29 +261,6 @@ class ROS2Manager:
             
         return topics
         
-    def _get_topic_type(self, topic_name):
-        """Get the message type for a topic - with dynamic timeout"""
-        try:
-            result = subprocess.run(
-                ['ros2', 'topic', 'type', topic_name],
-                capture_output=True,
-                text=True,
-                timeout=self._subprocess_timeout  # Use dynamic timeout
-            )
-            
-            if result.returncode == 0:
-                msg_type = result.stdout.strip()
-                if msg_type:
-                    return msg_type
-        except subprocess.TimeoutExpired:
-            # Silently fail - don't spam logs with timeout warnings
-            pass
-        except Exception as e:
-            # Silently fail for other errors too
-            pass
-            
-        return "Unknown"
-        
     def _get_publisher_count(self, topic_name):
         """Get the number of publishers for a topic"""
         try:
@@ -561,12 +537,7 @@ class ROS2Manager:
                     if self.current_bag_path and os.path.exists(self.current_bag_path):
                         try:
                             # Get total size of all files in bag directory
-                            total_size = 0
-                            for root, dirs, files in os.walk(self.current_bag_path):
-                                for f in files:
-                                    fp = os.path.join(root, f)
-                                    if os.path.exists(fp):
-                                        total_size += os.path.getsize(fp)
+                            total_size = dir_size_bytes(self.current_bag_path)
                             current_size_mb = total_size / 1024 / 1024
                             
                             # Calculate write speed
@@ -749,12 +720,8 @@ class ROS2Manager:
             
             if self.current_bag_path and os.path.exists(self.current_bag_path):
                 try:
-                    # Walk bag directory and sum all file sizes
-                    for root, _, files in os.walk(self.current_bag_path):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            if os.path.isfile(file_path):
-                                bag_size_mb += os.path.getsize(file_path) / (1024 * 1024)
+                    # Crawl bag directory and sum all file sizes
+                    bag_size_mb = dir_size_bytes(self.current_bag_path) / (1024 * 1024)
                     
                     # Calculate write speed if we have previous size
                     if hasattr(self, '_last_bag_size') and hasattr(self, '_last_size_check_time'):
@@ -790,7 +757,20 @@ class ROS2Manager:
         return self.current_bag_path
         
     def get_bag_info(self, bag_path):
-        """Get information about a bag file"""
+        """Get information about a bag file - cached until metadata.yaml changes"""
+        metadata_path = os.path.join(bag_path, 'metadata.yaml')
+        try:
+            st = os.stat(metadata_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None  # Still recording (or not a bag) - never cache
+        
+        if stamp is not None:
+            with self._cache_lock:
+                cached = self._bag_info_cache.get(bag_path)
+            if cached and cached[0] == stamp:
+                return dict(cached[1])
+        
         info = {
             'size_mb': 0,
             'duration': '0s',
@@ -801,20 +781,14 @@ class ROS2Manager:
         
         try:
             # Get directory size
-            total_size = 0
             if os.path.exists(bag_path):
-                for dirpath, dirnames, filenames in os.walk(bag_path):
-                    for filename in filenames:
-                        filepath = os.path.join(dirpath, filename)
-                        total_size += os.path.getsize(filepath)
-                        
+                total_size = dir_size_bytes(bag_path)
                 info['size_mb'] = total_size / (1024 * 1024)
                 
                 # Try to read metadata
-                metadata_path = os.path.join(bag_path, 'metadata.yaml')
-                if os.path.exists(metadata_path):
+                if stamp is not None:
                     with open(metadata_path, 'r') as f:
-                        metadata = yaml.safe_load(f)
+                        metadata = yaml.load(f, Loader=_YAML_LOADER)
                         
                     if metadata:
                         # Get topic count
@@ -837,6 +811,15 @@ class ROS2Manager:
                                 
         except Exception as e:
             print(f"Error getting bag info: {e}")
+            return info
+        
+        if stamp is not None:
+            with self._cache_lock:
+                self._bag_info_cache.pop(bag_path, None)
+                if len(self._bag_info_cache) >= self._bag_info_cache_max:
+                    # Evict oldest entry (dicts keep insertion order)
+                    self._bag_info_cache.pop(next(iter(self._bag_info_cache)))
+                self._bag_info_cache[bag_path] = (stamp, dict(info))
             
         return info
         
@@ -3,6 +3,7 @@ Advanced Topic Hz Monitor - Intelligent rate detection for all topic speeds
 Uses adaptive timeouts, progressive measurement, and background monitoring
 """
 
+import select
 import subprocess
 import threading
 import time
@@ -183,34 +184,38 @@ class TopicHzMonitor:
         """Measure Hz with specific timeout."""
         try:
             # Use Popen to read output as it streams
+            # Binary pipe: only the matching line is decoded. stderr is discarded - an
+            # undrained PIPE can fill up and stall the child
             process = subprocess.Popen(
                 ['ros2', 'topic', 'hz', topic_name],
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stderr=subprocess.DEVNULL
             )
             
-            start_time = time.time()
+            deadline = time.monotonic() + timeout
             last_hz = 0.0
             
             # Read output line by line with timeout
-            while time.time() - start_time < timeout:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
                 try:
-                    # Try to read a line with a short timeout
-                    import select
-                    if select.select([process.stdout], [], [], 0.1)[0]:
+                    # Block until output arrives or the deadline passes - no 100 ms polling
+                    if select.select([process.stdout], [], [], remaining)[0]:
                         line = process.stdout.readline()
-                        if line:
-                            if 'average rate:' in line.lower():
-                                try:
-                                    hz_str = line.split(':')[-1].strip().split()[0]
-                                    last_hz = max(0.0, float(hz_str))
-                                    # Got a valid measurement - terminate and return
-                                    process.terminate()
-                                    process.wait(timeout=0.5)
-                                    return last_hz
-                                except (ValueError, IndexError):
-                                    pass
+                        if not line:
+                            break  # Process exited - EOF stays readable, don't spin on it
+                        if b'average rate:' in line.lower():
+                            try:
+                                hz_str = line.decode('utf-8', 'replace').split(':')[-1].strip().split()[0]
+                                last_hz = max(0.0, float(hz_str))
+                                # Got a valid measurement - terminate and return
+                                process.terminate()
+                                process.wait(timeout=0.5)
+                                return last_hz
+                            except (ValueError, IndexError):
+                                pass
                 except Exception:
                     pass
             
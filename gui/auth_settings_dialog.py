@@ -332,44 +332,52 @@ Admin Key Set: {'✅ Yes' if status['admin_key_set'] else '❌ No'}
     def update_tokens_table(self):
         """Update tokens table"""
         tokens_list = self.auth_manager.list_tokens()
-        self.tokens_table.setRowCount(len(tokens_list))
         
-        for idx, token_info in enumerate(tokens_list):
-            # Token preview
-            item = QTableWidgetItem(token_info['token_preview'])
-            self.tokens_table.setItem(idx, 0, item)
-            
-            # Name
-            item = QTableWidgetItem(token_info['name'])
-            self.tokens_table.setItem(idx, 1, item)
-            
-            # Created
-            created = token_info['created_at'].split('T')[0]
-            item = QTableWidgetItem(created)
-            self.tokens_table.setItem(idx, 2, item)
-            
-            # Expires
-            expires = token_info['expires_at'].split('T')[0] if token_info['expires_at'] != 'Never' else 'Never'
-            item = QTableWidgetItem(expires)
-            self.tokens_table.setItem(idx, 3, item)
-            
-            # Valid
-            valid_text = "✅ Yes" if token_info['valid'] else "❌ No"
-            item = QTableWidgetItem(valid_text)
-            item.setForeground(QColor('green') if token_info['valid'] else QColor('red'))
-            self.tokens_table.setItem(idx, 4, item)
-            
-            # Last used
-            last_used = token_info['last_used'].split('T')[0] if token_info['last_used'] != 'Never' else 'Never'
-            item = QTableWidgetItem(last_used)
-            self.tokens_table.setItem(idx, 5, item)
-            
-            # Request count
-            item = QTableWidgetItem(str(token_info['request_count']))
-            item.setTextAlignment(4)  # Qt.AlignCenter = 4
-            self.tokens_table.setItem(idx, 6, item)
+        # Batch the fill - no per-cell repaints or itemChanged signals
+        self.tokens_table.setUpdatesEnabled(False)
+        self.tokens_table.blockSignals(True)
+        try:
+            self.tokens_table.setRowCount(len(tokens_list))
             
-            # Rate limit
-            item = QTableWidgetItem(str(token_info['rate_limit']))
-            item.setTextAlignment(4)  # Qt.AlignCenter = 4
-            self.tokens_table.setItem(idx, 7, item)
+            for idx, token_info in enumerate(tokens_list):
+                # Token preview
+                item = QTableWidgetItem(token_info['token_preview'])
+                self.tokens_table.setItem(idx, 0, item)
+                
+                # Name
+                item = QTableWidgetItem(token_info['name'])
+                self.tokens_table.setItem(idx, 1, item)
+                
+                # Created
+                created = token_info['created_at'].split('T')[0]
+                item = QTableWidgetItem(created)
+                self.tokens_table.setItem(idx, 2, item)
+                
+                # Expires
+                expires = token_info['expires_at'].split('T')[0] if token_info['expires_at'] != 'Never' else 'Never'
+                item = QTableWidgetItem(expires)
+                self.tokens_table.setItem(idx, 3, item)
+                
+                # Valid
+                valid_text = "✅ Yes" if token_info['valid'] else "❌ No"
+                item = QTableWidgetItem(valid_text)
+                item.setForeground(QColor('green') if token_info['valid'] else QColor('red'))
+                self.tokens_table.setItem(idx, 4, item)
+                
+                # Last used
+                last_used = token_info['last_used'].split('T')[0] if token_info['last_used'] != 'Never' else 'Never'
+                item = QTableWidgetItem(last_used)
+                self.tokens_table.setItem(idx, 5, item)
+                
+                # Request count
+                item = QTableWidgetItem(str(token_info['request_count']))
+                item.setTextAlignment(4)  # Qt.AlignCenter = 4
+                self.tokens_table.setItem(idx, 6, item)
+                
+                # Rate limit
+                item = QTableWidgetItem(str(token_info['rate_limit']))
+                item.setTextAlignment(4)  # Qt.AlignCenter = 4
+                self.tokens_table.setItem(idx, 7, item)
+        finally:
+            self.tokens_table.blockSignals(False)
+            self.tokens_table.setUpdatesEnabled(True)
@@ -12,7 +12,9 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,   #
 from PyQt5.QtCore import Qt, QTimer, pyqtSlot, QObject, QRunnable, QThreadPool, pyqtSignal, QEvent  # type: ignore
 from PyQt5.QtGui import QFont, QColor, QKeySequence  # type: ignore
 import os
+import sys
 import json
+import subprocess
 from datetime import datetime
 
 from core.ros2_manager import ROS2Manager  # type: ignore
@@ -30,7 +32,6 @@ from core.network_manager import NetworkManager  # type: ignore
 from core.recording_triggers import SmartRecordingManager  # type: ignore
 from core.performance_profiler import PerformanceProfiler  # type: ignore
 from core.performance_modes import PerformanceModeManager, PerformanceMode  # type: ignore
-from gui.performance_settings_dialog import PerformanceSettingsDialog  # type: ignore
 
 # Try to import auth settings dialog (optional)
 try:
@@ -108,6 +109,34 @@ class MetricsWorker(QRunnable):
             self.signals.error.emit(str(exc))
 
 
+class MetricsExportSignals(QObject):
+    """Signals used by the background metrics export worker."""
+
+    finished = pyqtSignal(str)  # filename
+    error = pyqtSignal(str)
+
+
+class MetricsExportWorker(QRunnable):
+    """Background worker that snapshots and writes metrics JSON off the GUI thread."""
+
+    def __init__(self, metrics_collector, filename: str):
+        super().__init__()
+        self.metrics_collector = metrics_collector
+        self.filename = filename
+        self.signals = MetricsExportSignals()
+
+    @pyqtSlot()
+    def run(self):
+        """Collect live metrics and write them to disk in a worker thread."""
+        try:
+            metrics = self.metrics_collector.get_live_metrics()
+            with open(self.filename, 'w') as f:
+                json.dump(metrics, f, indent=2)
+            self.signals.finished.emit(self.filename)
+        except Exception as exc:
+            self.signals.error.emit(str(exc))
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
     
@@ -120,6 +149,7 @@ class MainWindow(QMainWindow):
         # Initialize performance manager FIRST
         self.performance_manager = PerformanceModeManager()
         self.perf_settings = self.performance_manager.get_mode_settings()
+        self._perf_dialog = None  # Built on first open of Performance Settings
         
         print(f"\n{'='*60}")
         print(f"ROS2 Dashboard - Adaptive Performance Mode")
@@ -430,9 +460,14 @@ class MainWindow(QMainWindow):
 
     def show_performance_settings(self):
         """Show performance settings dialog"""
-        dialog = PerformanceSettingsDialog(self.performance_manager, self)
-        dialog.mode_changed.connect(self.on_performance_mode_changed)
-        dialog.exec_()
+        # ⚡ LAZY: import and build the dialog on first use, then reuse it
+        if self._perf_dialog is None:
+            from gui.performance_settings_dialog import PerformanceSettingsDialog  # type: ignore
+            self._perf_dialog = PerformanceSettingsDialog(self.performance_manager, self)
+            self._perf_dialog.mode_changed.connect(self.on_performance_mode_changed)
+        else:
+            self._perf_dialog.load_current_settings()
+        self._perf_dialog.exec_()
     
     def show_authentication_settings(self):
         """Show authentication settings dialog"""
@@ -526,27 +561,33 @@ class MainWindow(QMainWindow):
             
     def export_metrics(self):
         """Export current metrics (Ctrl+E shortcut)."""
-        try:
-            filename = f"ros2_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            metrics = self.metrics_collector.get_live_metrics()
-            
-            with open(filename, 'w') as f:
-                json.dump(metrics, f, indent=2)
-            
-            self.show_notification(
-                "Metrics Exported",
-                f"Saved to {filename}",
-                QSystemTrayIcon.Information
-            )
-            QMessageBox.information(self, "Export Successful", 
-                                  f"Metrics exported to {filename}")
-        except Exception as e:
-            self.show_notification(
-                "Export Failed",
-                str(e),
-                QSystemTrayIcon.Critical
-            )
-            QMessageBox.critical(self, "Export Failed", f"Error: {e}")
+        filename = f"ros2_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        
+        # ⚡ Snapshot + write in the background - slow disks must not freeze the UI
+        worker = MetricsExportWorker(self.metrics_collector, filename)
+        worker.signals.finished.connect(self._on_metrics_exported)
+        worker.signals.error.connect(self._on_metrics_export_failed)
+        self._export_worker = worker  # Keep signals alive until the worker reports back
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_metrics_exported(self, filename):
+        """Report a finished metrics export"""
+        self.show_notification(
+            "Metrics Exported",
+            f"Saved to {filename}",
+            QSystemTrayIcon.Information
+        )
+        QMessageBox.information(self, "Export Successful", 
+                              f"Metrics exported to {filename}")
+    
+    def _on_metrics_export_failed(self, error):
+        """Report a failed metrics export"""
+        self.show_notification(
+            "Export Failed",
+            error,
+            QSystemTrayIcon.Critical
+        )
+        QMessageBox.critical(self, "Export Failed", f"Error: {error}")
                 
     def show_keyboard_shortcuts_help(self):
         """Show keyboard shortcuts help dialog (Ctrl+H)"""
@@ -1155,7 +1196,8 @@ class MainWindow(QMainWindow):
         # Auto-upload if enabled and network manager is ready
         if self.network_manager:
             bag_path = self.ros2_manager.get_current_bag_path()
-            if bag_path and os.path.exists(bag_path):
+            if bag_path:
+                # Existence check + enqueue happen off the GUI thread
                 metadata = {
                     'type': 'ros2_bag',
                     'component': 'robot_recording',
@@ -1167,7 +1209,18 @@ class MainWindow(QMainWindow):
         """Open the recordings folder in file manager"""
         recordings_dir = self.ros2_manager.get_recordings_directory()
         if os.path.exists(recordings_dir):
-            os.system(f'xdg-open "{recordings_dir}"')
+            # ⚡ No shell, no wait: returns to the GUI thread immediately
+            try:
+                if os.name == 'nt':
+                    os.startfile(recordings_dir)  # type: ignore
+                else:
+                    opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                    subprocess.Popen([opener, recordings_dir],
+                                     stdout=subprocess.DEVNULL,
+                                     stderr=subprocess.DEVNULL,
+                                     start_new_session=True)
+            except Exception as e:
+                QMessageBox.warning(self, "Warning", f"Could not open recordings folder: {e}")
         else:
             QMessageBox.warning(self, "Warning", "Recordings directory does not exist yet.")
             
@@ -2,16 +2,66 @@
 Network Upload Widget - UI for network upload monitoring and control
 """
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,  # type: ignore
-                             QTableWidgetItem, QPushButton, QGroupBox, QHeaderView,
-                             QLabel, QLineEdit, QCheckBox, QProgressBar, QSpinBox,
-                             QMessageBox, QFileDialog)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal  # type: ignore
-from PyQt5.QtGui import QColor, QFont, QTextCursor  # type: ignore
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,  # type: ignore
+                             QPushButton, QGroupBox, QHeaderView,
+                             QLabel, QLineEdit, QCheckBox, QSpinBox,
+                             QMessageBox, QFileDialog, QApplication, QStyle,
+                             QStyledItemDelegate, QStyleOptionProgressBar)
+from PyQt5.QtCore import (Qt, QTimer, pyqtSignal, pyqtSlot, QObject, QRunnable, QThreadPool,  # type: ignore
+                          QAbstractTableModel, QModelIndex, QVariant)
+from PyQt5.QtGui import QColor  # type: ignore
+from collections import namedtuple
 from datetime import datetime
+from functools import lru_cache
 import os
 import time
 
+# ⚡ Parsed once - model data() hands these out on every paint
+COLOR_GREEN = QColor('green')
+COLOR_RED = QColor('red')
+COLOR_BLUE = QColor('blue')
+COLOR_ORANGE = QColor('orange')
+STATUS_COLORS = {'completed': COLOR_GREEN, 'failed': COLOR_RED, 'uploading': COLOR_BLUE}
+
+ALIGN_LEFT = Qt.AlignLeft | Qt.AlignVCenter
+ALIGN_CENTER = Qt.AlignCenter
+ALIGN_RIGHT = Qt.AlignRight | Qt.AlignVCenter
+
+# Row records built once per snapshot in the worker - attribute access, display text pre-baked
+PendingRow = namedtuple('PendingRow', 'file_path priority status progress file_size retry_count '
+                                      'basename size_text progress_text')
+HistoryRow = namedtuple('HistoryRow', 'file_path status completed_at file_size upload_duration '
+                                      'basename size_text duration_text')
+
+
+@lru_cache(maxsize=1024)
+def _file_display(file_path, file_size):
+    """(basename, size text) depend only on the file - computed once per upload"""
+    size_mb = file_size / 1048576 if file_size else 0.0
+    return os.path.basename(file_path), f"{size_mb:.2f}"
+
+
+def make_pending_row(upload):
+    basename, size_text = _file_display(upload['file_path'], upload['file_size'])
+    return PendingRow(upload['file_path'], upload['priority'], upload['status'],
+                      upload['progress'], upload['file_size'], upload['retry_count'],
+                      basename, size_text, f"{upload['progress']:.1f}%")
+
+
+def make_history_row(item):
+    basename, size_text = _file_display(item['file_path'], item['file_size'])
+    duration = item.get('upload_duration') or 0
+    return HistoryRow(item['file_path'], item['status'], item['completed_at'],
+                      item['file_size'], duration, basename, size_text, f"{duration:.1f}")
+
+
+# Connection label states: (text, stylesheet)
+CONNECTION_STATES = {
+    'uninitialized': ("● Not Initialized", "color: gray; font-weight: bold;"),
+    'online': ("● Online", "color: green; font-weight: bold;"),
+    'offline': ("● Offline", "color: red; font-weight: bold;"),
+}
+
 # Import authentication manager
 try:
     from core.auth_manager import AuthenticationManager
@@ -19,11 +69,240 @@ except ImportError:
     AuthenticationManager = None  # Fallback if not available
 
 
+class UploadEnqueueSignals(QObject):
+    """Signals used by the background enqueue worker."""
+
+    finished = pyqtSignal(str, bool)  # file_path, queued
+
+
+class UploadEnqueueWorker(QRunnable):
+    """Queues an upload off the GUI thread (stat + SQLite insert can stall on slow disks)."""
+
+    def __init__(self, network_manager, file_path, priority, metadata):
+        super().__init__()
+        self.network_manager = network_manager
+        self.file_path = file_path
+        self.priority = priority
+        self.metadata = metadata
+        self.signals = UploadEnqueueSignals()
+
+    @pyqtSlot()
+    def run(self):
+        queued = False
+        try:
+            if os.path.exists(self.file_path):
+                queued = bool(self.network_manager.add_upload(self.file_path, self.priority, self.metadata))
+        except Exception as e:
+            print(f"Error queuing upload for {self.file_path}: {e}")
+        self.signals.finished.emit(self.file_path, queued)
+
+
+class UploadSnapshotSignals(QObject):
+    """Signals used by the background snapshot worker."""
+
+    finished = pyqtSignal(list, list, dict)  # [PendingRow], [HistoryRow], stats
+    error = pyqtSignal(str)
+
+
+class UploadSnapshotWorker(QRunnable):
+    """Reads pending uploads, history and stats off the GUI thread (SQLite queries)."""
+
+    def __init__(self, network_manager, history_limit):
+        super().__init__()
+        self.network_manager = network_manager
+        self.history_limit = history_limit
+        self.signals = UploadSnapshotSignals()
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            pending = [make_pending_row(u) for u in self.network_manager.get_pending_uploads()]
+            history = [make_history_row(h) for h in
+                       self.network_manager.get_upload_history(limit=self.history_limit)]
+            stats = self.network_manager.get_stats()
+            self.signals.finished.emit(pending, history, stats)
+        except Exception as exc:  # pragma: no cover - defensive guard
+            self.signals.error.emit(str(exc))
+
+
+class ProgressDelegate(QStyledItemDelegate):
+    """Paints a progress bar from Qt.UserRole (0-100) - no per-row QProgressBar widget"""
+    
+    def paint(self, painter, option, index):
+        value = index.data(Qt.UserRole)
+        if value is None:
+            super().paint(painter, option, index)
+            return
+        
+        opt = QStyleOptionProgressBar()
+        opt.rect = option.rect.adjusted(2, 2, -2, -2)
+        opt.minimum = 0
+        opt.maximum = 100
+        opt.progress = int(value)
+        opt.text = f"{value:.1f}%"
+        opt.textVisible = True
+        opt.textAlignment = Qt.AlignCenter
+        opt.state = option.state
+        
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ProgressBar, opt, painter)
+
+
+class UploadRowsModel(QAbstractTableModel):
+    """Base model over a list of upload row tuples - rows are diffed, not rebuilt"""
+    
+    HEADERS = []
+    ALIGNMENTS = ()  # One flyweight alignment per column
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        
+    def row_key(self, row):
+        """Identity of a row across refreshes"""
+        return row.file_path
+        
+    def set_rows(self, rows):
+        """Apply new rows: remove vanished, insert new, refresh changed in place"""
+        rows = list(rows)
+        if not self._rows or not rows:
+            # ⚡ Initial fill / clear: one reset beats N insert/remove signals
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return
+        
+        new_keys = [self.row_key(r) for r in rows]
+        new_set = set(new_keys)
+        
+        # Remove vanished rows bottom-up so indices stay valid
+        for i in range(len(self._rows) - 1, -1, -1):
+            if self.row_key(self._rows[i]) not in new_set:
+                self.beginRemoveRows(QModelIndex(), i, i)
+                del self._rows[i]
+                self.endRemoveRows()
+        
+        old_keys = [self.row_key(r) for r in self._rows]
+        old_set = set(old_keys)
+        if [k for k in new_keys if k in old_set] != old_keys:
+            # Surviving rows were reordered (e.g. priority change) - reset
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return
+        
+        # Surviving rows are in order: walk new list, inserting gaps
+        first_changed = last_changed = None
+        for i, row in enumerate(rows):
+            if i >= len(self._rows) or self.row_key(self._rows[i]) != new_keys[i]:
+                self.beginInsertRows(QModelIndex(), i, i)
+                self._rows.insert(i, row)
+                self.endInsertRows()
+            elif self._rows[i] != row:
+                self._rows[i] = row
+                if first_changed is None:
+                    first_changed = i
+                last_changed = i
+        
+        # ⚡ One dataChanged for the whole dirty span instead of one per row
+        if first_changed is not None:
+            self.dataChanged.emit(self.index(first_changed, 0),
+                                  self.index(last_changed, len(self.HEADERS) - 1),
+                                  [Qt.DisplayRole, Qt.ForegroundRole, Qt.UserRole])
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return QVariant()
+
+
+class PendingUploadsModel(UploadRowsModel):
+    """Model over get_pending_uploads() rows - cells are rendered lazily by the view"""
+    
+    HEADERS = ["File", "Priority", "Status", "Progress", "Size (MB)", "Retries"]
+    ALIGNMENTS = (ALIGN_LEFT, ALIGN_CENTER, ALIGN_CENTER, ALIGN_CENTER, ALIGN_RIGHT, ALIGN_CENTER)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        upload = self._rows[index.row()]
+        col = index.column()
+        
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return upload.basename
+            if col == 1:
+                return str(upload.priority)
+            if col == 2:
+                return upload.status.upper()
+            if col == 3:
+                return upload.progress_text
+            if col == 4:
+                return upload.size_text
+            if col == 5:
+                return str(upload.retry_count)
+        elif role == Qt.UserRole and col == 3:
+            return float(upload.progress)
+        elif role == Qt.ForegroundRole:
+            if col == 2:
+                return STATUS_COLORS.get(upload.status, COLOR_ORANGE)
+            if col == 5 and upload.retry_count > 0:
+                return COLOR_ORANGE
+        elif role == Qt.TextAlignmentRole:
+            return self.ALIGNMENTS[col]
+        return QVariant()
+
+
+class UploadHistoryModel(UploadRowsModel):
+    """Model over get_upload_history() rows"""
+    
+    HEADERS = ["File", "Status", "Completed", "Size (MB)", "Duration (s)"]
+    ALIGNMENTS = (ALIGN_LEFT, ALIGN_CENTER, ALIGN_LEFT, ALIGN_RIGHT, ALIGN_RIGHT)
+    
+    def row_key(self, row):
+        # Same file can be uploaded more than once
+        return (row.file_path, row.completed_at)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        item = self._rows[index.row()]
+        col = index.column()
+        
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return item.basename
+            if col == 1:
+                return item.status.upper()
+            if col == 2:
+                return item.completed_at
+            if col == 3:
+                return item.size_text
+            if col == 4:
+                return item.duration_text
+        elif role == Qt.ForegroundRole and col == 1:
+            return COLOR_GREEN if item.status == 'completed' else COLOR_RED
+        elif role == Qt.TextAlignmentRole:
+            return self.ALIGNMENTS[col]
+        return QVariant()
+
+
 class NetworkUploadWidget(QWidget):
     """Widget for monitoring and controlling network uploads"""
     
     upload_requested = pyqtSignal(str, int, dict)  # file_path, priority, metadata
     
+    # ⚡ Adaptive refresh: fast while bytes are moving, slow when idle
+    ACTIVE_INTERVAL_MS = 500
+    IDLE_INTERVAL_MS = 5000
+    HISTORY_LIMIT = 50  # View renders only visible rows, so the full backend page is cheap
+    
     def __init__(self, network_manager):
         super().__init__()
         self.network_manager = network_manager
@@ -31,12 +310,42 @@ class NetworkUploadWidget(QWidget):
         # Initialize authentication manager if available
         self.auth_manager = AuthenticationManager() if AuthenticationManager else None
         
-        self.init_ui()
+        # Last connection state shown (restyle only on transitions)
+        self._connection_state = None
+        
+        # Fingerprints of the last rows pushed to the models (dirty check)
+        self._pending_sig = None
+        self._history_sig = None
+        
+        # Background snapshot reads - one in flight at a time
+        self.snapshot_thread_pool = QThreadPool()
+        self.snapshot_thread_pool.setMaxThreadCount(1)
+        self._snapshot_task_running = False
+        self._snapshot_requested = False
         
-        # Setup update timer
+        # Setup update timer - runs only while visible (see showEvent/hideEvent)
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_display)  # type: ignore
-        self.update_timer.start(2000)  # Update every 2 seconds
+        self.update_timer.setInterval(self.IDLE_INTERVAL_MS)
+        
+        # Debounce timer for the Refresh button (burst of clicks -> one refresh)
+        self._refresh_debounce_timer = QTimer()
+        self._refresh_debounce_timer.setSingleShot(True)
+        self._refresh_debounce_timer.timeout.connect(self.update_display)
+        
+        self.init_ui()
+        
+    def showEvent(self, event):
+        """Resume polling (with an immediate refresh) when the tab becomes visible"""
+        super().showEvent(event)
+        if not self.update_timer.isActive():
+            self.update_display()
+            self.update_timer.start()
+            
+    def hideEvent(self, event):
+        """Stop polling while the tab is hidden"""
+        super().hideEvent(event)
+        self.update_timer.stop()
         
     def init_ui(self):
         """Initialize UI components"""
@@ -46,8 +355,8 @@ class NetworkUploadWidget(QWidget):
         status_group = QGroupBox("Network Status & Authentication")
         status_layout = QHBoxLayout()
         
-        self.connection_label = QLabel("● Offline")
-        self.connection_label.setStyleSheet("color: red; font-weight: bold;")
+        self.connection_label = QLabel()
+        self._set_connection_state('offline')
         status_layout.addWidget(self.connection_label)
         
         # Auth status indicator
@@ -89,16 +398,17 @@ class NetworkUploadWidget(QWidget):
         self.pending_label = QLabel("Pending: 0")
         self.bytes_label = QLabel("Bytes: 0 MB")
         
-        stats_layout.addWidget(self.uploaded_label)
-        stats_layout.addWidget(QLabel("|"))
-        stats_layout.addWidget(self.failed_label)
-        stats_layout.addWidget(QLabel("|"))
-        stats_layout.addWidget(self.pending_label)
-        stats_layout.addWidget(QLabel("|"))
-        stats_layout.addWidget(self.bytes_label)
+        # Separators are a CSS border, not extra "|" QLabel widgets
+        for label in (self.uploaded_label, self.failed_label, self.pending_label):
+            label.setObjectName("statLabel")
+        for label in (self.uploaded_label, self.failed_label, self.pending_label, self.bytes_label):
+            stats_layout.addWidget(label)
         stats_layout.addStretch()
         
         stats_group.setLayout(stats_layout)
+        stats_group.setStyleSheet(
+            "QLabel#statLabel { padding-right: 8px; margin-right: 8px; border-right: 1px solid gray; }"
+        )
         layout.addWidget(stats_group)
         
         # Upload Control Group
@@ -173,21 +483,21 @@ class NetworkUploadWidget(QWidget):
         pending_group = QGroupBox("Pending Uploads")
         pending_layout = QVBoxLayout()
         
-        self.pending_table = QTableWidget()
-        self.pending_table.setColumnCount(6)
-        self.pending_table.setHorizontalHeaderLabels([
-            "File", "Priority", "Status", "Progress", "Size (MB)", "Retries"
-        ])
+        # ⚡ Model/view: only visible cells are rendered, no per-cell items
+        self.pending_model = PendingUploadsModel(self)
+        self.pending_table = QTableView()
+        self.pending_table.setModel(self.pending_model)
+        self.progress_delegate = ProgressDelegate(self.pending_table)
+        self.pending_table.setItemDelegateForColumn(3, self.progress_delegate)
         
         header = self.pending_table.horizontalHeader()
         if header:
+            # ⚡ Fixed widths: ResizeToContents re-measures every cell on each row change
+            header.setMinimumSectionSize(60)
             header.setSectionResizeMode(0, QHeaderView.Stretch)
-            header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-            header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-            header.setSectionResizeMode(3, QHeaderView.Fixed)
-            header.setMinimumSectionSize(120)
-            header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
-            header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
+            for col, width in ((1, 70), (2, 100), (3, 120), (4, 90), (5, 70)):
+                header.setSectionResizeMode(col, QHeaderView.Fixed)
+                header.resizeSection(col, width)
         
         pending_layout.addWidget(self.pending_table)
         
@@ -195,7 +505,7 @@ class NetworkUploadWidget(QWidget):
         btn_layout = QHBoxLayout()
         
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(self.update_display)
+        refresh_btn.clicked.connect(self.request_refresh)
         btn_layout.addWidget(refresh_btn)
         
         btn_layout.addStretch()
@@ -217,13 +527,17 @@ class NetworkUploadWidget(QWidget):
         history_group = QGroupBox("Recent Upload History")
         history_layout = QVBoxLayout()
         
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(5)
-        self.history_table.setHorizontalHeaderLabels([
-            "File", "Status", "Completed", "Size (MB)", "Duration (s)"
-        ])
+        self.history_model = UploadHistoryModel(self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
         self.history_table.setMaximumHeight(150)
         
+        # ⚡ Uniform row heights: no per-row sizeHint pass over off-screen rows
+        for view in (self.pending_table, self.history_table):
+            rows_header = view.verticalHeader()
+            rows_header.setSectionResizeMode(QHeaderView.Fixed)
+            rows_header.setDefaultSectionSize(24)
+        
         history_header = self.history_table.horizontalHeader()
         if history_header:
             history_header.setSectionResizeMode(0, QHeaderView.Stretch)
@@ -239,118 +553,99 @@ class NetworkUploadWidget(QWidget):
         self.update_display()
         
     def update_display(self):
-        """Update the display with current data"""
+        """Update the display with current data - DB reads happen in a worker"""
+        # Check if network manager is available
+        if not self.network_manager:
+            self._set_connection_state('uninitialized')
+            return
+            
+        # Update connection status
+        self._set_connection_state('online' if self.network_manager.is_online else 'offline')
+        
+        if self._snapshot_task_running:
+            # Coalesce: re-run once the in-flight snapshot lands
+            self._snapshot_requested = True
+            return
+        
+        worker = UploadSnapshotWorker(self.network_manager, self.HISTORY_LIMIT)
+        worker.signals.finished.connect(self._apply_snapshot)  # type: ignore[arg-type]
+        worker.signals.error.connect(self._handle_snapshot_error)  # type: ignore[arg-type]
+        self._snapshot_task_running = True
+        self.snapshot_thread_pool.start(worker)
+        
+    @pyqtSlot(list, list, dict)
+    def _apply_snapshot(self, pending, history, stats):
+        """Receive a snapshot from the worker thread and refresh UI"""
+        self._snapshot_task_running = False
         try:
-            # Check if network manager is available
-            if not self.network_manager:
-                self.connection_label.setText("● Not Initialized")
-                self.connection_label.setStyleSheet("color: gray; font-weight: bold;")
-                return
-                
-            # Update connection status
-            if self.network_manager.is_online:
-                self.connection_label.setText("● Online")
-                self.connection_label.setStyleSheet("color: green; font-weight: bold;")
-            else:
-                self.connection_label.setText("● Offline")
-                self.connection_label.setStyleSheet("color: red; font-weight: bold;")
-                
             # Update statistics
-            stats = self.network_manager.get_stats()
             self.uploaded_label.setText(f"Uploaded: {stats['total_uploaded']}")
             self.failed_label.setText(f"Failed: {stats['total_failed']}")
             self.pending_label.setText(f"Pending: {stats['queued_uploads']}")
             self.bytes_label.setText(f"Bytes: {stats['bytes_uploaded'] / (1024*1024):.2f} MB")
             
-            # Update pending uploads table
-            pending = self.network_manager.get_pending_uploads()
-            self.pending_table.setRowCount(len(pending))
+            interval = (self.ACTIVE_INTERVAL_MS if any(u.status == 'uploading' for u in pending)
+                        else self.IDLE_INTERVAL_MS)
+            if self.update_timer.interval() != interval:
+                self.update_timer.setInterval(interval)
             
-            for idx, upload in enumerate(pending):
-                # File name
-                filename = os.path.basename(upload['file_path'])
-                file_item = QTableWidgetItem(filename)
-                self.pending_table.setItem(idx, 0, file_item)
-                
-                # Priority
-                priority_item = QTableWidgetItem(str(upload['priority']))
-                priority_item.setTextAlignment(4)  # Qt.AlignCenter = 4
-                self.pending_table.setItem(idx, 1, priority_item)
-                
-                # Status
-                status_item = QTableWidgetItem(upload['status'].upper())
-                status_item.setTextAlignment(4)  # Qt.AlignCenter = 4
-                
-                if upload['status'] == 'completed':
-                    status_item.setForeground(QColor('green'))
-                elif upload['status'] == 'failed':
-                    status_item.setForeground(QColor('red'))
-                elif upload['status'] == 'uploading':
-                    status_item.setForeground(QColor('blue'))
-                else:
-                    status_item.setForeground(QColor('orange'))
-                    
-                self.pending_table.setItem(idx, 2, status_item)
-                
-                # Progress bar
-                progress_bar = QProgressBar()
-                progress_bar.setMinimum(0)
-                progress_bar.setMaximum(100)
-                progress_bar.setValue(int(upload['progress']))
-                progress_bar.setFormat(f"{upload['progress']:.1f}%")
-                self.pending_table.setCellWidget(idx, 3, progress_bar)
-                
-                # File size
-                size_mb = upload['file_size'] / (1024*1024) if upload['file_size'] else 0
-                size_item = QTableWidgetItem(f"{size_mb:.2f}")
-                size_item.setTextAlignment(2 | 128)  # Qt.AlignRight | Qt.AlignVCenter = 2 | 128
-                self.pending_table.setItem(idx, 4, size_item)
-                
-                # Retry count
-                retry_item = QTableWidgetItem(str(upload['retry_count']))
-                retry_item.setTextAlignment(4)  # Qt.AlignCenter = 4
-                if upload['retry_count'] > 0:
-                    retry_item.setForeground(QColor('orange'))
-                self.pending_table.setItem(idx, 5, retry_item)
-                
-            # Update history table
-            history = self.network_manager.get_upload_history(limit=10)
-            self.history_table.setRowCount(len(history))
-            
-            for idx, item in enumerate(history):
-                # File name
-                filename = os.path.basename(item['file_path'])
-                file_item = QTableWidgetItem(filename)
-                self.history_table.setItem(idx, 0, file_item)
-                
-                # Status
-                status_item = QTableWidgetItem(item['status'].upper())
-                status_item.setTextAlignment(4)  # Qt.AlignCenter = 4
-                if item['status'] == 'completed':
-                    status_item.setForeground(QColor('green'))
-                else:
-                    status_item.setForeground(QColor('red'))
-                self.history_table.setItem(idx, 1, status_item)
-                
-                # Completed time
-                time_item = QTableWidgetItem(item['completed_at'])
-                self.history_table.setItem(idx, 2, time_item)
+            # ⚡ Dirty check: idle queues cost two tuple compares, not a repaint
+            updates = []
+            pending_sig = tuple((u.file_path, u.status, u.progress_text, u.retry_count, u.priority)
+                                for u in pending)
+            if pending_sig != self._pending_sig:
+                self._pending_sig = pending_sig
+                updates.append((self.pending_table, self.pending_model, pending))
                 
-                # Size
-                size_mb = item['file_size'] / (1024*1024) if item['file_size'] else 0
-                size_item = QTableWidgetItem(f"{size_mb:.2f}")
-                size_item.setTextAlignment(2 | 128)  # Qt.AlignRight | Qt.AlignVCenter = 2 | 128
-                self.history_table.setItem(idx, 3, size_item)
+            history_sig = tuple((h.file_path, h.status, h.completed_at) for h in history)
+            if history_sig != self._history_sig:
+                self._history_sig = history_sig
+                updates.append((self.history_table, self.history_model, history))
                 
-                # Duration
-                duration = item.get('upload_duration', 0) or 0
-                duration_item = QTableWidgetItem(f"{duration:.1f}")
-                duration_item.setTextAlignment(2 | 128)  # Qt.AlignRight | Qt.AlignVCenter = 2 | 128
-                self.history_table.setItem(idx, 4, duration_item)
+            if updates:
+                # ⚡ Batch fill: one repaint per view.
+                # Snapshot lists arrive via a queued signal and the models are only
+                # touched here, on the GUI thread - so data() never sees a half-applied list.
+                for table, _, _ in updates:
+                    table.setUpdatesEnabled(False)
+                try:
+                    for _, model, rows in updates:
+                        model.set_rows(rows)
+                finally:
+                    for table, _, _ in updates:
+                        table.setUpdatesEnabled(True)
                 
         except Exception as e:
             print(f"Error updating network display: {e}")
             
+        if self._snapshot_requested:
+            self._snapshot_requested = False
+            self.update_display()
+            
+    @pyqtSlot(str)
+    def _handle_snapshot_error(self, message):
+        """Log snapshot worker errors without crashing the UI"""
+        self._snapshot_task_running = False
+        self._snapshot_requested = False
+        print(f"Error updating network display: {message}")
+            
+    def request_refresh(self):
+        """Debounced manual refresh"""
+        self._refresh_debounce_timer.start(250)  # Restarts on every click
+        
+    def _schedule_refresh(self):
+        """Refresh on the next event-loop pass (after any modal dialog has returned)"""
+        QTimer.singleShot(0, self.update_display)
+        
+    def _set_connection_state(self, state):
+        """Update connection label only when the state changes (setStyleSheet re-parses CSS)"""
+        if state == self._connection_state:
+            return
+        self._connection_state = state
+        text, style = CONNECTION_STATES[state]
+        self.connection_label.setText(text)
+        self.connection_label.setStyleSheet(style)
+        
     def update_server_url(self):
         """Update the server URL"""
         new_url = self.server_url_input.text()
@@ -430,7 +725,7 @@ class NetworkUploadWidget(QWidget):
             
             self.network_manager.add_upload(file_path, priority, metadata)
             QMessageBox.information(self, "Success", f"File added to upload queue: {os.path.basename(file_path)}")
-            self.update_display()
+            self._schedule_refresh()
             
     def add_recording_upload(self, bag_path, metadata=None):
         """Add a recording to upload queue"""
@@ -443,7 +738,17 @@ class NetworkUploadWidget(QWidget):
             upload_metadata = metadata or {}
             upload_metadata['source'] = 'ros2_recording'
             
-            self.network_manager.add_upload(bag_path, priority, upload_metadata)
+            # ⚡ Widget state is read here; the file check + DB insert run on the pool
+            worker = UploadEnqueueWorker(self.network_manager, bag_path, priority, upload_metadata)
+            worker.signals.finished.connect(self._on_upload_enqueued)
+            QThreadPool.globalInstance().start(worker)
+            
+    def _on_upload_enqueued(self, file_path, queued):
+        """Refresh once a background enqueue lands (GUI thread)"""
+        if queued:
+            self.update_display()
+        else:
+            print(f"Recording not queued for upload: {file_path}")
             
     def retry_all_failed(self):
         """Retry all failed uploads"""
@@ -455,14 +760,11 @@ class NetworkUploadWidget(QWidget):
                 QMessageBox.information(self, "No Failed Uploads", "There are no failed uploads to retry")
                 return
             
-            retry_count = 0
-            for upload in failed_uploads:
-                # Reset status to pending so it will be retried
-                self.network_manager.retry_upload(upload['file_path'])
-                retry_count += 1
+            # Reset status to pending so they will be retried (one transaction)
+            retry_count = self.network_manager.retry_uploads([u['file_path'] for u in failed_uploads])
             
             QMessageBox.information(self, "Success", f"Queued {retry_count} failed upload(s) for retry")
-            self.update_display()
+            self._schedule_refresh()
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to retry uploads: {str(e)}")
         
@@ -476,14 +778,11 @@ class NetworkUploadWidget(QWidget):
                 QMessageBox.information(self, "No Completed Uploads", "There are no completed uploads to clear")
                 return
             
-            cleared_count = 0
-            for upload in completed_uploads:
-                # Remove completed upload from tracking
-                self.network_manager.clear_upload(upload['file_path'])
-                cleared_count += 1
+            # Remove completed uploads from tracking (one transaction)
+            cleared_count = self.network_manager.clear_uploads([u['file_path'] for u in completed_uploads])
             
             QMessageBox.information(self, "Success", f"Cleared {cleared_count} completed upload(s) from the list")
-            self.update_display()
+            self._schedule_refresh()
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to clear completed uploads: {str(e)}")
     
@@ -554,7 +853,7 @@ class NetworkUploadWidget(QWidget):
                 self.network_manager.update_upload_metadata(upload['file_path'], metadata)
             
             # Update display
-            self.update_display()
+            self._schedule_refresh()
             
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to start batch upload: {str(e)}")
@@ -5,10 +5,10 @@ Allows users to view and change performance modes
 
 from PyQt5.QtWidgets import (  # type: ignore
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-    QRadioButton, QGroupBox, QPushButton, QTextEdit,
+    QRadioButton, QGroupBox, QPushButton, QPlainTextEdit,
     QSpinBox, QCheckBox, QFormLayout, QTabWidget, QWidget
 )
-from PyQt5.QtCore import Qt, pyqtSignal  # type: ignore
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer  # type: ignore
 from core.performance_modes import PerformanceMode, PerformanceModeManager  # type: ignore
 
 
@@ -17,12 +17,68 @@ class PerformanceSettingsDialog(QDialog):
     
     mode_changed = pyqtSignal(PerformanceMode)
     
+    # Static text built once per class instead of per dialog / per refresh
+    _MODE_DESCRIPTIONS = {
+        PerformanceMode.HIGH: ("  Ultra-responsive (16GB+ RAM, 8+ cores)\n"
+                               "  • 1s ROS2 updates\n"
+                               "  • 250ms metrics updates\n"
+                               "  • 500ms chart updates\n"
+                               "  • 6 threads, 4 concurrent operations"),
+        PerformanceMode.BALANCED: ("  Recommended for most systems (8-16GB RAM, 4-8 cores)\n"
+                                   "  • 3s ROS2 updates\n"
+                                   "  • 500ms metrics updates\n"
+                                   "  • 1s chart updates\n"
+                                   "  • 3 threads, 2 concurrent operations"),
+        PerformanceMode.LOW: ("  Resource-efficient (<8GB RAM, <4 cores)\n"
+                              "  • 5s ROS2 updates\n"
+                              "  • 1s metrics updates\n"
+                              "  • 2s chart updates\n"
+                              "  • 2 threads, 1 concurrent operation"),
+    }
+    # One dialog-level stylesheet, matched by objectName, instead of per-label setStyleSheet
+    _STYLESHEET = (
+        "QLabel#modeDesc { color: #666; font-size: 10px; margin-left: 20px; }"
+        "QLabel#modeDescDisabled { color: #999; font-size: 10px; margin-left: 20px; }"
+        "QLabel#advancedInfo { color: #666; font-style: italic; }"
+    )
+    _SETTINGS_TEMPLATE = (
+        "Current Mode Settings:\n\n"
+        "Timer Intervals:\n"
+        "  ROS2 Update: {ros2_update_interval}ms\n"
+        "  Metrics Update: {metrics_update_interval}ms\n"
+        "  History Update: {history_update_interval}ms\n"
+        "  Chart Update: {chart_update_interval}ms\n\n"
+        "Thread Pool:\n"
+        "  Max Threads: {max_threads}\n"
+        "  Concurrent Operations: {max_concurrent_threads}\n\n"
+        "Cache Settings:\n"
+        "  Cache Timeout: {cache_timeout}s\n"
+        "  System Metrics Cache: {system_metrics_cache}s\n"
+        "  Topic Check Interval: {topic_check_interval}s\n\n"
+        "Chart Settings:\n"
+        "  Buffer Size: {chart_buffer_size} samples\n"
+        "  Auto-Pause: {chart_auto_pause_text}\n\n"
+        "Memory Settings:\n"
+        "  History Max Entries: {history_max_entries}\n"
+        "  Profiler Enabled: {enable_profiler_text}\n"
+        "  Lazy Load Widgets: {lazy_load_widgets_text}\n"
+    )
+    
     def __init__(self, performance_manager: PerformanceModeManager, parent=None):
         super().__init__(parent)
         self.performance_manager = performance_manager
         self.setWindowTitle("Performance Settings")
         self.setMinimumWidth(600)
         self.setMinimumHeight(500)
+        self.setStyleSheet(self._STYLESHEET)
+        
+        self._suppress_display_update = False
+        
+        # Coalesce bursts of radio toggles into one settings-display refresh
+        self._display_timer = QTimer(self)
+        self._display_timer.setSingleShot(True)
+        self._display_timer.setInterval(50)
+        self._display_timer.timeout.connect(self.update_settings_display)
         
         self.setup_ui()
         self.load_current_settings()
@@ -41,7 +97,7 @@ class PerformanceSettingsDialog(QDialog):
         # System info
         info_group = QGroupBox("System Information")
         info_layout = QVBoxLayout()
-        self.info_text = QTextEdit()
+        self.info_text = QPlainTextEdit()  # Plain-text layout; these panes never hold rich text
         self.info_text.setReadOnly(True)
         self.info_text.setMaximumHeight(150)
         self.info_text.setPlainText(self.performance_manager.get_system_info_text())
@@ -57,45 +113,33 @@ class PerformanceSettingsDialog(QDialog):
         
         # High performance
         self.mode_radios[PerformanceMode.HIGH] = QRadioButton("High Performance")
-        high_desc = QLabel("  Ultra-responsive (16GB+ RAM, 8+ cores)\n"
-                          "  • 1s ROS2 updates\n"
-                          "  • 250ms metrics updates\n"
-                          "  • 500ms chart updates\n"
-                          "  • 6 threads, 4 concurrent operations")
-        high_desc.setStyleSheet("color: #666; font-size: 10px; margin-left: 20px;")
+        high_desc = self._make_desc(self._MODE_DESCRIPTIONS[PerformanceMode.HIGH])
         modes_layout.addWidget(self.mode_radios[PerformanceMode.HIGH])
         modes_layout.addWidget(high_desc)
         
         # Balanced
         self.mode_radios[PerformanceMode.BALANCED] = QRadioButton("Balanced")
-        balanced_desc = QLabel("  Recommended for most systems (8-16GB RAM, 4-8 cores)\n"
-                              "  • 3s ROS2 updates\n"
-                              "  • 500ms metrics updates\n"
-                              "  • 1s chart updates\n"
-                              "  • 3 threads, 2 concurrent operations")
-        balanced_desc.setStyleSheet("color: #666; font-size: 10px; margin-left: 20px;")
+        balanced_desc = self._make_desc(self._MODE_DESCRIPTIONS[PerformanceMode.BALANCED])
         modes_layout.addWidget(self.mode_radios[PerformanceMode.BALANCED])
         modes_layout.addWidget(balanced_desc)
         
         # Low performance
         self.mode_radios[PerformanceMode.LOW] = QRadioButton("Low Performance")
-        low_desc = QLabel("  Resource-efficient (<8GB RAM, <4 cores)\n"
-                         "  • 5s ROS2 updates\n"
-                         "  • 1s metrics updates\n"
-                         "  • 2s chart updates\n"
-                         "  • 2 threads, 1 concurrent operation")
-        low_desc.setStyleSheet("color: #666; font-size: 10px; margin-left: 20px;")
+        low_desc = self._make_desc(self._MODE_DESCRIPTIONS[PerformanceMode.LOW])
         modes_layout.addWidget(self.mode_radios[PerformanceMode.LOW])
         modes_layout.addWidget(low_desc)
         
         # Custom (future feature)
         self.mode_radios[PerformanceMode.CUSTOM] = QRadioButton("Custom")
         self.mode_radios[PerformanceMode.CUSTOM].setEnabled(False)
-        custom_desc = QLabel("  User-defined settings (coming soon)")
-        custom_desc.setStyleSheet("color: #999; font-size: 10px; margin-left: 20px;")
+        custom_desc = self._make_desc("  User-defined settings (coming soon)", "modeDescDisabled")
         modes_layout.addWidget(self.mode_radios[PerformanceMode.CUSTOM])
         modes_layout.addWidget(custom_desc)
         
+        for radio in self.mode_radios.values():
+            # lambda drops the bool arg so it is not taken as start(msec)
+            radio.toggled.connect(lambda _checked: self._display_timer.start())
+        
         modes_group.setLayout(modes_layout)
         mode_layout.addWidget(modes_group)
         
@@ -107,31 +151,12 @@ class PerformanceSettingsDialog(QDialog):
         mode_layout.addStretch()
         tabs.addTab(mode_tab, "Performance Modes")
         
-        # Tab 2: Advanced Settings
-        advanced_tab = QWidget()
-        advanced_layout = QVBoxLayout(advanced_tab)
-        
-        advanced_info = QLabel(
-            "Advanced settings for fine-tuning performance.\n"
-            "Note: Changing these requires application restart."
-        )
-        advanced_info.setStyleSheet("color: #666; font-style: italic;")
-        advanced_layout.addWidget(advanced_info)
-        
-        # Current mode settings display
-        settings_group = QGroupBox("Current Mode Settings")
-        settings_layout = QFormLayout()
-        
-        self.settings_text = QTextEdit()
-        self.settings_text.setReadOnly(True)
-        self.settings_text.setMaximumHeight(300)
-        settings_layout.addRow(self.settings_text)
-        
-        settings_group.setLayout(settings_layout)
-        advanced_layout.addWidget(settings_group)
-        
-        advanced_layout.addStretch()
-        tabs.addTab(advanced_tab, "Advanced")
+        # Tab 2: Advanced Settings - built on first visit (most users never open it)
+        self._advanced_built = False
+        self.settings_text = None
+        self.advanced_tab = QWidget()
+        tabs.addTab(self.advanced_tab, "Advanced")
+        tabs.currentChanged.connect(self._ensure_advanced_built)
         
         layout.addWidget(tabs)
         
@@ -153,6 +178,44 @@ class PerformanceSettingsDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    @staticmethod
+    def _make_desc(text, object_name="modeDesc"):
+        """Create an indented mode description label"""
+        label = QLabel(text)
+        label.setObjectName(object_name)
+        return label
+    
+    def _ensure_advanced_built(self, index):
+        """Build the Advanced tab contents the first time it is shown"""
+        if self._advanced_built or index != 1:
+            return
+        self._advanced_built = True
+        
+        advanced_layout = QVBoxLayout(self.advanced_tab)
+        
+        advanced_info = QLabel(
+            "Advanced settings for fine-tuning performance.\n"
+            "Note: Changing these requires application restart."
+        )
+        advanced_info.setObjectName("advancedInfo")
+        advanced_layout.addWidget(advanced_info)
+        
+        # Current mode settings display
+        settings_group = QGroupBox("Current Mode Settings")
+        settings_layout = QFormLayout()
+        
+        self.settings_text = QPlainTextEdit()
+        self.settings_text.setReadOnly(True)
+        self.settings_text.setMaximumHeight(300)
+        settings_layout.addRow(self.settings_text)
+        
+        settings_group.setLayout(settings_layout)
+        advanced_layout.addWidget(settings_group)
+        
+        advanced_layout.addStretch()
+        
+        self.update_settings_display()
+    
     def load_current_settings(self):
         """Load and display current settings"""
         current_mode = self.performance_manager.get_current_mode()
@@ -166,36 +229,21 @@ class PerformanceSettingsDialog(QDialog):
     
     def update_settings_display(self):
         """Update the settings display text"""
+        # Advanced tab not built yet - it renders the current selection when first opened
+        if self.settings_text is None:
+            return
+        
         # Get selected mode
         selected_mode = self.get_selected_mode()
         if selected_mode:
             settings = self.performance_manager.get_mode_settings(selected_mode)
             
-            settings_text = "Current Mode Settings:\n\n"
-            
-            settings_text += "Timer Intervals:\n"
-            settings_text += f"  ROS2 Update: {settings['ros2_update_interval']}ms\n"
-            settings_text += f"  Metrics Update: {settings['metrics_update_interval']}ms\n"
-            settings_text += f"  History Update: {settings['history_update_interval']}ms\n"
-            settings_text += f"  Chart Update: {settings['chart_update_interval']}ms\n\n"
-            
-            settings_text += "Thread Pool:\n"
-            settings_text += f"  Max Threads: {settings['max_threads']}\n"
-            settings_text += f"  Concurrent Operations: {settings['max_concurrent_threads']}\n\n"
-            
-            settings_text += "Cache Settings:\n"
-            settings_text += f"  Cache Timeout: {settings['cache_timeout']}s\n"
-            settings_text += f"  System Metrics Cache: {settings['system_metrics_cache']}s\n"
-            settings_text += f"  Topic Check Interval: {settings['topic_check_interval']}s\n\n"
-            
-            settings_text += "Chart Settings:\n"
-            settings_text += f"  Buffer Size: {settings['chart_buffer_size']} samples\n"
-            settings_text += f"  Auto-Pause: {'Yes' if settings['chart_auto_pause'] else 'No'}\n\n"
-            
-            settings_text += "Memory Settings:\n"
-            settings_text += f"  History Max Entries: {settings['history_max_entries']}\n"
-            settings_text += f"  Profiler Enabled: {'Yes' if settings['enable_profiler'] else 'No'}\n"
-            settings_text += f"  Lazy Load Widgets: {'Yes' if settings['lazy_load_widgets'] else 'No'}\n"
+            settings_text = self._SETTINGS_TEMPLATE.format(
+                chart_auto_pause_text='Yes' if settings['chart_auto_pause'] else 'No',
+                enable_profiler_text='Yes' if settings['enable_profiler'] else 'No',
+                lazy_load_widgets_text='Yes' if settings['lazy_load_widgets'] else 'No',
+                **settings
+            )
             
             self.settings_text.setPlainText(settings_text)
     
@@ -208,8 +256,8 @@ class PerformanceSettingsDialog(QDialog):
     
     def auto_detect_mode(self):
         """Auto-detect and select optimal mode"""
-        # Re-detect system specs
-        self.performance_manager.system_info = self.performance_manager._detect_system_specs()
+        # Re-detect system specs (cached for 5s - repeated clicks skip the psutil probes)
+        self.performance_manager.refresh_system_specs(max_age=5.0)
         optimal_mode = self.performance_manager._auto_detect_mode()
         
         # Update UI
@@ -225,9 +273,15 @@ class PerformanceSettingsDialog(QDialog):
         selected_mode = self.get_selected_mode()
         self.performance_manager.set_mode(selected_mode)
         self.mode_changed.emit(selected_mode)
-        self.update_settings_display()
+        # Skip the text rebuild when the dialog is about to close (OK)
+        if not self._suppress_display_update:
+            self.update_settings_display()
     
     def accept_settings(self):
         """Apply settings and close dialog"""
-        self.apply_settings()
+        self._suppress_display_update = True
+        try:
+            self.apply_settings()
+        finally:
+            self._suppress_display_update = False
         self.accept()
@@ -9,10 +9,12 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,  #
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QThread  # type: ignore
 from PyQt5.QtGui import QFont, QColor
 import os
-from datetime import datetime
+import json
+from concurrent.futures import ThreadPoolExecutor
 import threading
 import time
 import subprocess
+from contextlib import contextmanager
 
 # Import dynamic scaling for 1000+ topics support
 try:
@@ -133,9 +135,56 @@ class HzMonitorThread(QThread):
 
 
 
+class TopicStat:
+    """Live rate / data status for one selected topic"""
+    
+    __slots__ = ('rate', 'last_rate', 'stalled', 'stalled_count', 'msg_type', 'has_data')
+    
+    def __init__(self):
+        self.rate = 0.0
+        self.last_rate = 0.0
+        self.stalled = False
+        self.stalled_count = 0
+        self.msg_type = 'Unknown'
+        self.has_data = False
+
+
 class RecordingControlWidget(QWidget):
     """Widget for controlling ROS2 bag recording"""
     
+    # ⚡ ADAPTIVE POLLING: back off when nothing changes, speed up again on change
+    RATES_FAST_INTERVAL_MS = 5000  # One topics RPC per tick - 5 s is the base rate
+    RATES_SLOW_INTERVAL_MS = 15000
+    RATES_STABLE_TICKS = 3
+    
+    # Shared item styling - built once instead of per cell per tick
+    _COLOR_DATA_OK = QColor('#00c853')  # Bright Green
+    _COLOR_NO_DATA = QColor('#d32f2f')  # Bright Red
+    _COLOR_STALLED = QColor('#ff6f00')  # Orange
+    _COLOR_ACTIVE = QColor('#4CAF50')   # Green
+    _COLOR_IDLE = QColor('#ff9800')     # Orange
+    _FONT_MONO = QFont("Monospace", 9)
+    _FONT_MONO_SMALL = QFont("Monospace", 8)
+    _FONT_BOLD = QFont("", -1, QFont.Bold)
+    
+    # Static widget styling, applied once at the widget level and matched by objectName
+    _STYLESHEET = (
+        "QPushButton#startBtn { background-color: #4CAF50; color: white; font-size: 14px; font-weight: bold; }"
+        "QPushButton#stopBtn { background-color: #f44336; color: white; font-size: 14px; font-weight: bold; }"
+        "QLabel#topicsInfo { color: #666; font-style: italic; }"
+    )
+    
+    # (text, color, font) per cell state; font None = table default
+    _DATA_STATES = {
+        True: ("🟢 DATA OK", _COLOR_DATA_OK, _FONT_BOLD),
+        False: ("🔴 NO DATA", _COLOR_NO_DATA, _FONT_BOLD),
+    }
+    _ALERT_STATES = {
+        'stalled': ("⚠️ STALLED", _COLOR_STALLED, _FONT_BOLD),
+        True: ("✅ ACTIVE", _COLOR_ACTIVE, None),
+        False: ("⏸️ IDLE", _COLOR_IDLE, None),
+    }
+    
     recording_started = pyqtSignal()
     recording_stopped = pyqtSignal()
     
@@ -146,8 +195,16 @@ class RecordingControlWidget(QWidget):
         self.is_recording = False
         self.current_bag_name = None
         self.current_bag_metadata = None
-        self._last_rates_update = 0
-        self._rates_update_cooldown = 5.0  # 5 seconds minimum - VERY infrequent updates to prevent blocking
+        self._last_rates_update = float('-inf')  # time.monotonic() of the last topics RPC
+        self._last_rendered = {}  # {topic_name: (rate, stalled, has_data, msg_type)} last drawn in the table
+        self._stable_ticks = 0
+        self._batch_depth = 0
+        self._refresh_pending = False
+        self._topics_index_source = None  # topics_info list that _topics_index was built from
+        self._topics_index = {}
+        
+        # One long-lived worker for small file writes instead of a thread per recording
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recording-io")
         
         # Initialize Hz monitor thread (runs continuously in background)
         self.hz_monitor_thread = HzMonitorThread(ros2_manager)
@@ -205,13 +262,13 @@ class RecordingControlWidget(QWidget):
         
         self.start_btn = QPushButton("Start Recording")
         self.start_btn.setMinimumHeight(50)
-        self.start_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-size: 14px; font-weight: bold; }")
+        self.start_btn.setObjectName("startBtn")
         self.start_btn.clicked.connect(self.start_recording)
         control_layout.addWidget(self.start_btn)
         
         self.stop_btn = QPushButton("Stop Recording")
         self.stop_btn.setMinimumHeight(50)
-        self.stop_btn.setStyleSheet("QPushButton { background-color: #f44336; color: white; font-size: 14px; font-weight: bold; }")
+        self.stop_btn.setObjectName("stopBtn")
         self.stop_btn.clicked.connect(self.stop_recording)
         self.stop_btn.setEnabled(False)
         control_layout.addWidget(self.stop_btn)
@@ -254,19 +311,33 @@ class RecordingControlWidget(QWidget):
         
         # Info label
         self.topics_info_label = QLabel("No topics selected yet")
-        self.topics_info_label.setStyleSheet("color: #666; font-style: italic;")
+        self.topics_info_label.setObjectName("topicsInfo")
         topics_layout.addWidget(self.topics_info_label)
         
         topics_group.setLayout(topics_layout)
         layout.addWidget(topics_group)
         
         # Initialize topics tracking with message type and data presence
-        self.selected_topics_data = {}  # {topic_name: {'rate': 0.0, 'msg_type': '', 'has_data': False, ...}}
+        self.selected_topics_data = {}  # {topic_name: TopicStat}
+        self._row_items = {}  # {topic_name: (topic, type, rate, status, alert) QTableWidgetItems}
         self.topic_rates_timer = QTimer()
         self.topic_rates_timer.timeout.connect(self.update_topic_rates)
         
         self.setLayout(layout)
+        self.setStyleSheet(self._STYLESHEET)
         
+    def showEvent(self, event):
+        """Resume rate polling and catch the table up when the tab becomes visible"""
+        super().showEvent(event)
+        if self.is_recording:
+            self.start_rate_monitoring()
+        self._refresh_if_changed()
+    
+    def hideEvent(self, event):
+        """Stop rate polling while the tab is hidden"""
+        super().hideEvent(event)
+        self.stop_rate_monitoring()
+    
     def browse_directory(self):
         """Open directory browser"""
         directory = QFileDialog.getExistingDirectory(
@@ -294,7 +365,7 @@ class RecordingControlWidget(QWidget):
         
         # Generate bag name with timestamp
         prefix = self.name_input.text() or "recording"
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         
         # If recording from discovered robot, include robot name
         if robot_metadata and 'hostname' in robot_metadata:
@@ -305,19 +376,8 @@ class RecordingControlWidget(QWidget):
         
         # Save robot metadata to JSON if provided (async to avoid blocking)
         if robot_metadata:
-            def _save_metadata():
-                metadata_file = os.path.join(output_dir, f"{bag_name}_robot_info.json")
-                try:
-                    import json
-                    with open(metadata_file, 'w') as f:
-                        json.dump(robot_metadata, f, indent=2)
-                    print(f"✅ Saved robot metadata to {metadata_file}")
-                except Exception as e:
-                    print(f"⚠️ Could not save robot metadata: {e}")
-            
-            # Run in background thread to avoid UI blocking
-            import threading
-            threading.Thread(target=_save_metadata, daemon=True).start()
+            metadata_file = os.path.join(output_dir, f"{bag_name}_robot_info.json")
+            self._io_executor.submit(self._save_metadata, metadata_file, robot_metadata)
         
         # Start recording - CRITICAL: This is the main operation
         success = self.ros2_manager.start_recording(bag_name)
@@ -352,6 +412,16 @@ class RecordingControlWidget(QWidget):
         else:
             QMessageBox.critical(self, "Error", "Failed to start recording. Make sure ROS2 is running.")
             
+    @staticmethod
+    def _save_metadata(metadata_file, robot_metadata):
+        """Write robot metadata as compact JSON (runs on the IO executor)"""
+        try:
+            with open(metadata_file, 'w') as f:
+                json.dump(robot_metadata, f, separators=(',', ':'))
+            print(f"✅ Saved robot metadata to {metadata_file}")
+        except Exception as e:
+            print(f"⚠️ Could not save robot metadata: {e}")
+    
     def stop_recording(self):
         """Stop bag recording - OPTIMIZED for speed"""
         # Stop immediately on UI
@@ -391,98 +461,149 @@ class RecordingControlWidget(QWidget):
     
     def update_selected_topics(self, selected_topics):
         """Update the list of selected topics for recording"""
-        # Initialize tracking for new topics
-        for topic in selected_topics:
-            if topic not in self.selected_topics_data:
-                self.selected_topics_data[topic] = {
-                    'rate': 0.0,
-                    'last_rate': 0.0,
-                    'stalled': False,
-                    'stalled_count': 0,
-                    'msg_type': 'Unknown',
-                    'has_data': False
-                }
-        
-        # Remove topics no longer selected
-        removed_topics = [t for t in self.selected_topics_data if t not in selected_topics]
-        for topic in removed_topics:
-            del self.selected_topics_data[topic]
-        
-        # Update table
-        self.refresh_selected_topics_table()
+        with self._batch():
+            # Set diff - O(N+M) instead of list membership per topic
+            selected = set(selected_topics)
+            removed_topics = self.selected_topics_data.keys() - selected
+            
+            # Initialize tracking for new topics (in selection order)
+            for topic in selected_topics:
+                if topic not in self.selected_topics_data:
+                    self.selected_topics_data[topic] = TopicStat()
+            
+            # Remove topics no longer selected
+            for topic in removed_topics:
+                del self.selected_topics_data[topic]
+            
+            # Update table
+            self.refresh_selected_topics_table()
         
         # Tell Hz monitor about topics (even if not recording yet)
         self.hz_monitor_thread.set_topics(selected_topics)
         
         # Start rate update timer if recording
         if self.is_recording and not self.topic_rates_timer.isActive():
-            self.topic_rates_timer.start(1000)  # Update every second
+            self.topic_rates_timer.start(self.RATES_FAST_INTERVAL_MS)
+    
+    def _rendered_snapshot(self):
+        """Per-topic values that affect what the table shows"""
+        return {
+            name: (round(data.rate, 2), data.stalled, data.has_data, data.msg_type)
+            for name, data in self.selected_topics_data.items()
+        }
+    
+    def _refresh_if_changed(self):
+        """Repaint the table only when the rendered values differ, and adapt the poll interval"""
+        # Hidden table: keep the data current, showEvent renders the difference
+        if not self.isVisible():
+            return
+        
+        snapshot = self._rendered_snapshot()
+        if snapshot != self._last_rendered:
+            self._stable_ticks = 0
+            if self.topic_rates_timer.isActive() and self.topic_rates_timer.interval() != self.RATES_FAST_INTERVAL_MS:
+                self.topic_rates_timer.setInterval(self.RATES_FAST_INTERVAL_MS)
+            self.refresh_selected_topics_table()
+            return
+        
+        self._stable_ticks += 1
+        if (self._stable_ticks >= self.RATES_STABLE_TICKS and self.topic_rates_timer.isActive()
+                and self.topic_rates_timer.interval() != self.RATES_SLOW_INTERVAL_MS):
+            self.topic_rates_timer.setInterval(self.RATES_SLOW_INTERVAL_MS)
+    
+    @contextmanager
+    def _batch(self):
+        """Reentrant batch - table repaints and refreshes coalesce until the outermost block exits"""
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            # BATCH UPDATES - Disable updates during bulk changes (smoother rendering)
+            self.selected_topics_table.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                try:
+                    if self._refresh_pending:
+                        self._refresh_pending = False
+                        self._render_selected_topics()
+                finally:
+                    # RE-ENABLE UPDATES - All changes rendered at once (smoother, faster)
+                    self.selected_topics_table.setUpdatesEnabled(True)
     
     def refresh_selected_topics_table(self):
         """Refresh the selected topics table display with data status and message type - OPTIMIZED"""
-        # BATCH UPDATES - Disable updates during bulk changes (smoother rendering)
-        self.selected_topics_table.setUpdatesEnabled(False)
+        # Any number of refreshes requested inside a batch render once when it closes
+        with self._batch():
+            self._refresh_pending = True
+    
+    def _render_selected_topics(self):
+        """Reconcile table rows with selected_topics_data (call inside _batch)"""
+        self._last_rendered = self._rendered_snapshot()
+        
+        # ⚡ PERSISTENT ROWS: remove dropped topics bottom-up, append new ones, keep the rest
+        removed = [t for t in self._row_items if t not in self.selected_topics_data]
+        removed.sort(key=lambda t: self._row_items[t][0].row(), reverse=True)
+        for topic_name in removed:
+            self.selected_topics_table.removeRow(self._row_items.pop(topic_name)[0].row())
         
-        self.selected_topics_table.setRowCount(len(self.selected_topics_data))
+        for topic_name in self.selected_topics_data:
+            if topic_name not in self._row_items:
+                self._row_items[topic_name] = self._create_topic_row(topic_name)
         
         if not self.selected_topics_data:
             self.topics_info_label.setText("No topics selected yet")
-            self.selected_topics_table.setUpdatesEnabled(True)
             return
         
         self.topics_info_label.setText(f"Monitoring {len(self.selected_topics_data)} topic(s)")
         
-        for row, (topic_name, data) in enumerate(self.selected_topics_data.items()):
-            # Topic name
-            topic_item = QTableWidgetItem(topic_name)
-            topic_item.setFont(QFont("Monospace", 9))
-            self.selected_topics_table.setItem(row, 0, topic_item)
-            
-            # Message Type
-            msg_type = data.get('msg_type', 'Unknown')
-            type_item = QTableWidgetItem(msg_type)
-            type_item.setFont(QFont("Monospace", 8))
-            self.selected_topics_table.setItem(row, 1, type_item)
-            
-            # Rate
-            rate = data['rate']
-            rate_item = QTableWidgetItem(f"{rate:.2f} Hz")
-            self.selected_topics_table.setItem(row, 2, rate_item)
-            
-            # Data Status with COLOR CODING (GREEN = has data, RED = no data)
-            has_data = data.get('has_data', False)
-            if has_data:
-                status = "🟢 DATA OK"
-                status_item = QTableWidgetItem(status)
-                status_item.setForeground(QColor('#00c853'))  # Bright Green
-                status_item.setFont(QFont("", -1, QFont.Bold))
-            else:
-                status = "🔴 NO DATA"
-                status_item = QTableWidgetItem(status)
-                status_item.setForeground(QColor('#d32f2f'))  # Bright Red
-                status_item.setFont(QFont("", -1, QFont.Bold))
-            
-            self.selected_topics_table.setItem(row, 3, status_item)
-            
-            # Alert/Warning System
-            if data['stalled']:
-                alert = "⚠️ STALLED"
-                alert_item = QTableWidgetItem(alert)
-                alert_item.setForeground(QColor('#ff6f00'))  # Orange
-                alert_item.setFont(QFont("", -1, QFont.Bold))
-            elif rate > 0:
-                alert = "✅ ACTIVE"
-                alert_item = QTableWidgetItem(alert)
-                alert_item.setForeground(QColor('#4CAF50'))  # Green
-            else:
-                alert = "⏸️ IDLE"
-                alert_item = QTableWidgetItem(alert)
-                alert_item.setForeground(QColor('#ff9800'))  # Orange
-            
-            self.selected_topics_table.setItem(row, 4, alert_item)
-        
-        # RE-ENABLE UPDATES - All changes rendered at once (smoother, faster)
-        self.selected_topics_table.setUpdatesEnabled(True)
+        for topic_name, data in self.selected_topics_data.items():
+            self._update_topic_row(self._row_items[topic_name], data)
+    
+    def _create_topic_row(self, topic_name):
+        """Append a row for a newly selected topic and return its items"""
+        row = self.selected_topics_table.rowCount()
+        self.selected_topics_table.insertRow(row)
+        
+        topic_item = QTableWidgetItem(topic_name)
+        topic_item.setFont(self._FONT_MONO)
+        type_item = QTableWidgetItem()
+        type_item.setFont(self._FONT_MONO_SMALL)
+        items = (topic_item, type_item, QTableWidgetItem(), QTableWidgetItem(), QTableWidgetItem())
+        
+        for col, item in enumerate(items):
+            self.selected_topics_table.setItem(row, col, item)
+        return items
+    
+    def _update_topic_row(self, items, data):
+        """Update an existing row in place, touching only cells whose text changed"""
+        _, type_item, rate_item, status_item, alert_item = items
+        
+        # Message Type
+        msg_type = data.msg_type
+        if type_item.text() != msg_type:
+            type_item.setText(msg_type)
+        
+        # Rate
+        rate = data.rate
+        rate_text = f"{rate:.2f} Hz"
+        if rate_item.text() != rate_text:
+            rate_item.setText(rate_text)
+        
+        # Data Status with COLOR CODING (GREEN = has data, RED = no data)
+        status, color, font = self._DATA_STATES[data.has_data]
+        if status_item.text() != status:
+            status_item.setText(status)
+            status_item.setForeground(color)
+            status_item.setData(Qt.FontRole, font)
+        
+        # Alert/Warning System - stalled wins regardless of rate
+        alert_key = 'stalled' if data.stalled else rate > 0
+        alert, color, font = self._ALERT_STATES[alert_key]
+        if alert_item.text() != alert:
+            alert_item.setText(alert)
+            alert_item.setForeground(color)
+            alert_item.setData(Qt.FontRole, font)
     
     def update_topic_rates(self):
         """Update topic rates (called periodically during recording) - NON-BLOCKING"""
@@ -490,9 +611,15 @@ class RecordingControlWidget(QWidget):
             self.topic_rates_timer.stop()
             return
         
-        # DEBOUNCE - prevent excessive calls (AGGRESSIVE - 2 second minimum)
-        current_time = time.time()
-        if current_time - self._last_rates_update < self._rates_update_cooldown:
+        # Nobody is looking - skip the RPC (showEvent restarts polling)
+        if not self.isVisible():
+            return
+        
+        # DEBOUNCE - the adaptive timer sets the pace; only drop ticks that arrive early
+        # (e.g. right after a restart). monotonic: immune to wall-clock jumps
+        current_time = time.monotonic()
+        min_gap = self.topic_rates_timer.interval() * 0.0009  # 90% of the interval, in seconds
+        if current_time - self._last_rates_update < min_gap:
             return
         self._last_rates_update = current_time
         
@@ -514,8 +641,12 @@ class RecordingControlWidget(QWidget):
     def _process_topics_info(self, topics_info):
         """Process topics info and update display - EXTRACTED to prevent blocking"""
         try:
-            # Build a lookup for fast access
-            topics_by_name = {t['name']: t for t in topics_info}
+            # Build a lookup for fast access - ros2_manager returns the same cached list
+            # within its TTL, so only re-index when a new list arrives
+            if topics_info is not self._topics_index_source:
+                self._topics_index = {t['name']: t for t in topics_info}
+                self._topics_index_source = topics_info
+            topics_by_name = self._topics_index
             
             # Update rates for each selected topic
             for topic_name, data in self.selected_topics_data.items():
@@ -527,32 +658,32 @@ class RecordingControlWidget(QWidget):
                     msg_type = topic_data.get('type', 'Unknown')
                     
                     # Store previous rate for stall detection
-                    data['last_rate'] = data['rate']
-                    data['rate'] = rate
+                    data.last_rate = data.rate
+                    data.rate = rate
                     
                     # Set has_data based on rate (if publishing, has_data = True)
-                    data['has_data'] = rate > 0
+                    data.has_data = rate > 0
                     
                     # Detect stalling: rate dropped to 0 from non-zero
-                    if data['last_rate'] > 0 and rate == 0:
-                        data['stalled'] = True
-                        data['stalled_count'] += 1
+                    if data.last_rate > 0 and rate == 0:
+                        data.stalled = True
+                        data.stalled_count += 1
                     elif rate > 0:
-                        data['stalled'] = False
-                        data['stalled_count'] = 0
+                        data.stalled = False
+                        data.stalled_count = 0
                     
                     # Update message type
                     if msg_type and msg_type != "Unknown":
-                        data['msg_type'] = msg_type
+                        data.msg_type = msg_type
                 else:
                     # Topic disappeared
-                    data['rate'] = 0.0
-                    data['has_data'] = False
-                    data['stalled'] = True
-                    data['stalled_count'] += 1
+                    data.rate = 0.0
+                    data.has_data = False
+                    data.stalled = True
+                    data.stalled_count += 1
             
-            # Refresh table display
-            self.refresh_selected_topics_table()
+            # Refresh table display only if something visible changed
+            self._refresh_if_changed()
             
         except Exception as e:
             print(f"Error processing topic rates: {e}")
@@ -570,22 +701,22 @@ class RecordingControlWidget(QWidget):
                         hz = hz_value
                     
                     data = self.selected_topics_data[topic_name]
-                    data['last_rate'] = data['rate']
-                    data['rate'] = hz
+                    data.last_rate = data.rate
+                    data.rate = hz
                     
                     # Set has_data based on rate
-                    data['has_data'] = hz > 0
+                    data.has_data = hz > 0
                     
                     # Detect stalling
-                    if data['last_rate'] > 0 and hz == 0:
-                        data['stalled'] = True
-                        data['stalled_count'] += 1
+                    if data.last_rate > 0 and hz == 0:
+                        data.stalled = True
+                        data.stalled_count += 1
                     elif hz > 0:
-                        data['stalled'] = False
-                        data['stalled_count'] = 0
+                        data.stalled = False
+                        data.stalled_count = 0
             
-            # Refresh table display (batched updates)
-            self.refresh_selected_topics_table()
+            # Refresh table display only if something visible changed
+            self._refresh_if_changed()
             
         except Exception as e:
             print(f"Error in Hz update callback: {e}")
@@ -593,8 +724,9 @@ class RecordingControlWidget(QWidget):
     def start_rate_monitoring(self):
         """Start monitoring topic rates - VERY INFREQUENT to eliminate freezing"""
         if not self.topic_rates_timer.isActive() and self.selected_topics_data:
-            # 5 seconds = almost no subprocess calls, use cache instead
-            self.topic_rates_timer.start(5000)  # Update every 5 seconds (was 2 seconds)
+            # Start fast; _refresh_if_changed backs off once rates settle
+            self._stable_ticks = 0
+            self.topic_rates_timer.start(self.RATES_FAST_INTERVAL_MS)
     
     def stop_rate_monitoring(self):
         """Stop monitoring topic rates"""
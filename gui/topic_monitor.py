@@ -3,11 +3,175 @@
 Topic Monitor Widget - displays available ROS2 topics
 """
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,  # type: ignore
-                             QTableWidgetItem, QPushButton, QGroupBox, QHeaderView,
-                             QLabel, QCheckBox)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer  # type: ignore
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,  # type: ignore
+                             QPushButton, QGroupBox, QHeaderView, QLabel)
+from PyQt5.QtCore import (Qt, pyqtSignal, QTimer,  # type: ignore
+                          QAbstractTableModel, QModelIndex, QVariant)
 from PyQt5.QtGui import QColor  # type: ignore
+from array import array
+from operator import itemgetter
+
+# ⚡ Parsed once - model data() hands these out on every paint
+COLOR_ACTIVE = QColor('green')
+COLOR_IDLE = QColor('gray')
+COLOR_WARN = QColor('orange')
+
+ALIGN_LEFT = Qt.AlignLeft | Qt.AlignVCenter
+ALIGN_CENTER = Qt.AlignCenter
+ALIGN_RIGHT = Qt.AlignRight | Qt.AlignVCenter
+
+# get_topics_info() always fills these keys, so rows are read without .get() defaults
+TOPIC_FIELDS = itemgetter('name', 'type', 'publisher_count', 'hz')
+
+# Record column is a checkable cell (no per-row QWidget/QCheckBox/layout)
+CHECK_FLAGS = Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+
+
+class TopicsModel(QAbstractTableModel):
+    """Topic rows stored column-wise in flat arrays - cells are rendered lazily by the view"""
+    
+    HEADERS = ["Record", "Topic Name", "Message Type", "Publishers", "Hz", "Status"]
+    ALIGNMENTS = (ALIGN_CENTER, ALIGN_LEFT, ALIGN_LEFT, ALIGN_CENTER, ALIGN_RIGHT, ALIGN_CENTER)
+    
+    topic_toggled = pyqtSignal(str, bool)  # topic_name, is_checked - one connection for all rows
+    
+    def __init__(self, is_selected, parent=None):
+        super().__init__(parent)
+        self._is_selected = is_selected  # name -> bool; the selection set lives on the widget
+        self.names = []
+        self.types = []
+        self.pub_counts = array('i')
+        self.hzs = array('d')
+        self._row_of = {}
+    
+    def set_topics(self, topics_info):
+        """Apply a new topic list: remove vanished, insert new, refresh changed in place"""
+        # ⚡ One C-level pass transposes the row dicts into columns
+        columns = list(zip(*map(TOPIC_FIELDS, topics_info))) or [(), (), (), ()]
+        names = list(columns[0])
+        types = list(columns[1])
+        pub_counts = array('i', columns[2])
+        hzs = array('d', columns[3])
+        
+        if names != self.names and not self._apply_row_diff(names, types, pub_counts, hzs):
+            # ⚡ Initial fill / clear / reorder: one reset beats N insert/remove signals
+            self.beginResetModel()
+            self.names, self.types, self.pub_counts, self.hzs = names, types, pub_counts, hzs
+            self._row_of = {name: row for row, name in enumerate(names)}
+            self.endResetModel()
+            return
+        
+        # Rows line up now - repaint only the span whose cells differ (usually none)
+        first = last = None
+        for row in range(len(names)):
+            if (types[row] != self.types[row] or pub_counts[row] != self.pub_counts[row]
+                    or hzs[row] != self.hzs[row]):
+                if first is None:
+                    first = row
+                last = row
+        self.types, self.pub_counts, self.hzs = types, pub_counts, hzs
+        if first is not None:
+            self.dataChanged.emit(self.index(first, 2), self.index(last, len(self.HEADERS) - 1),
+                                  [Qt.DisplayRole, Qt.ForegroundRole])
+    
+    def _apply_row_diff(self, names, types, pub_counts, hzs):
+        """Insert/remove rows so self.names == names; False if a reset is cheaper"""
+        if not self.names or not names:
+            return False
+        new_set = set(names)
+        
+        # Remove vanished rows bottom-up so indices stay valid
+        for i in range(len(self.names) - 1, -1, -1):
+            if self.names[i] not in new_set:
+                self.beginRemoveRows(QModelIndex(), i, i)
+                del self.names[i], self.types[i], self.pub_counts[i], self.hzs[i]
+                self.endRemoveRows()
+        
+        old_set = set(self.names)
+        if [n for n in names if n in old_set] != self.names:
+            return False  # Surviving rows were reordered
+        
+        # Surviving rows are in order: walk the new list, inserting gaps
+        for i, name in enumerate(names):
+            if i >= len(self.names) or self.names[i] != name:
+                self.beginInsertRows(QModelIndex(), i, i)
+                self.names.insert(i, name)
+                self.types.insert(i, types[i])
+                self.pub_counts.insert(i, pub_counts[i])
+                self.hzs.insert(i, hzs[i])
+                self.endInsertRows()
+        self._row_of = {name: row for row, name in enumerate(names)}
+        return True
+    
+    def set_hz(self, hz_dict):
+        """Apply background Hz results with one dataChanged over the dirty span"""
+        first = last = None
+        for name, hz in hz_dict.items():
+            row = self._row_of.get(name)
+            if row is None or self.hzs[row] == hz:
+                continue
+            self.hzs[row] = hz
+            first = row if first is None else min(first, row)
+            last = row if last is None else max(last, row)
+        if first is not None:
+            self.dataChanged.emit(self.index(first, 4), self.index(last, 4), [Qt.DisplayRole])
+    
+    def refresh_check_states(self):
+        """Selection changed outside the view (select all, programmatic) - repaint Record"""
+        if self.names:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.names) - 1, 0),
+                                  [Qt.CheckStateRole])
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return QVariant()
+    
+    def flags(self, index):
+        if index.isValid() and index.column() == 0:
+            return CHECK_FLAGS
+        return Qt.ItemIsEnabled
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        row = index.row()
+        col = index.column()
+        
+        if role == Qt.DisplayRole:
+            if col == 1:
+                return self.names[row]
+            if col == 2:
+                return self.types[row]
+            if col == 3:
+                return str(self.pub_counts[row])
+            if col == 4:
+                return f"{self.hzs[row]:.1f}"
+            if col == 5:
+                return "Publishing" if self.pub_counts[row] > 0 else "Idle"
+        elif role == Qt.CheckStateRole and col == 0:
+            return Qt.Checked if self._is_selected(self.names[row]) else Qt.Unchecked
+        elif role == Qt.ForegroundRole:
+            if col == 3:
+                return COLOR_ACTIVE if self.pub_counts[row] > 0 else COLOR_IDLE
+            if col == 5:
+                return COLOR_ACTIVE if self.pub_counts[row] > 0 else COLOR_WARN
+        elif role == Qt.TextAlignmentRole:
+            return self.ALIGNMENTS[col]
+        return QVariant()
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid() or index.column() != 0:
+            return False
+        self.topic_toggled.emit(self.names[index.row()], value == Qt.Checked)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
 
 
 class TopicMonitorWidget(QWidget):
@@ -16,6 +180,11 @@ class TopicMonitorWidget(QWidget):
     topic_selected = pyqtSignal(str, bool)  # topic_name, is_selected
     topics_changed = pyqtSignal(list)  # emitted when selected topics change
     
+    # Worker -> GUI thread hand-off: the model may only be touched on the GUI thread
+    _topics_fetched = pyqtSignal(object)  # topics_info list
+    _topics_fetch_failed = pyqtSignal()
+    _hz_fetched = pyqtSignal(object)  # {topic_name: hz}
+    
     def __init__(self, ros2_manager, async_ros2_manager=None):
         super().__init__()
         self.ros2_manager = ros2_manager
@@ -43,6 +212,11 @@ class TopicMonitorWidget(QWidget):
         self._current_topics_info = []  # Cache for periodic refresh
         self._is_recording = False  # Track recording state
         
+        # Emitted from pool threads, so these connections are queued to the GUI thread
+        self._topics_fetched.connect(self._on_topics_ready)
+        self._topics_fetch_failed.connect(self._on_topics_failed)
+        self._hz_fetched.connect(self._update_hz_values)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -70,13 +244,13 @@ class TopicMonitorWidget(QWidget):
         
         group_layout.addLayout(info_layout)
         
-        # Topics table - OPTIMIZED FOR SMOOTH SCROLLING
-        self.topics_table = QTableWidget()
-        self.topics_table.setColumnCount(6)
-        self.topics_table.setHorizontalHeaderLabels([
-            "Record", "Topic Name", "Message Type", "Publishers", "Hz", "Status"
-        ])
-        
+        # Topics table - model/view, so cells are only materialised when painted
+        self.topics_model = TopicsModel(lambda name: name in self.selected_topics, self)
+        # One connection for every row's checkbox - the model passes the topic name itself
+        self.topics_model.topic_toggled.connect(self.on_topic_selected)
+        self.topics_table = QTableView()
+        self.topics_table.setModel(self.topics_model)
+
         # CRITICAL PERFORMANCE: Disable sorting to prevent layout recalculation
         self.topics_table.setSortingEnabled(False)
         
@@ -86,8 +260,8 @@ class TopicMonitorWidget(QWidget):
             vheader.setDefaultSectionSize(25)
         
         # Reduce selection overhead
-        self.topics_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.topics_table.setSelectionMode(QTableWidget.NoSelection)
+        self.topics_table.setSelectionBehavior(QTableView.SelectRows)
+        self.topics_table.setSelectionMode(QTableView.NoSelection)
         
         # Set column widths
         header = self.topics_table.horizontalHeader()
@@ -146,11 +320,10 @@ class TopicMonitorWidget(QWidget):
                         # Perform blocking call in thread
                         topics_info = worker_self.parent.ros2_manager.get_topics_info()
                         # Call callback on main thread via Qt signal
-                        worker_self.parent._on_topics_ready(topics_info)
+                        worker_self.parent._topics_fetched.emit(topics_info)
                     except Exception as e:
                         print(f"Error refreshing topics (async fallback): {e}")
-                        worker_self.parent.topic_count_label.setText(f"Topics: 0 (Error: ROS2 may not be running)")
-                        worker_self.parent._is_updating = False
+                        worker_self.parent._topics_fetch_failed.emit()
             
             # Queue in thread pool (non-blocking)
             if not hasattr(self, '_refresh_threadpool'):
@@ -178,6 +351,11 @@ class TopicMonitorWidget(QWidget):
                 self._pending_update = False
                 self._do_refresh()
     
+    def _on_topics_failed(self):
+        """Fallback refresh failed in the worker - report it on the GUI thread"""
+        self.topic_count_label.setText(f"Topics: 0 (Error: ROS2 may not be running)")
+        self._is_updating = False
+    
     def set_recording_state(self, is_recording):
         """Track recording state to enable/disable real-time Hz monitoring"""
         self._is_recording = is_recording
@@ -225,11 +403,11 @@ class TopicMonitorWidget(QWidget):
                         self.topics, 
                         max_workers=4
                     )
-                    # Update UI with fetched Hz values
-                    self.parent._update_hz_values(hz_dict)
                 except Exception:
                     # Silently ignore - Hz values are just a nice-to-have
-                    pass
+                    return
+                # Update UI with fetched Hz values (queued to the GUI thread)
+                self.parent._hz_fetched.emit(hz_dict)
         
         # Use a persistent thread pool for Hz fetching
         if not hasattr(self, '_hz_threadpool'):
@@ -240,54 +418,25 @@ class TopicMonitorWidget(QWidget):
         self._hz_threadpool.start(worker)
     
     def _update_hz_values(self, hz_dict):
-        """Update Hz column with fetched values (called from background thread via Qt)"""
-        try:
-            self.topics_table.setUpdatesEnabled(False)
-            
-            # Update each row with fetched Hz value
-            for row in range(self.topics_table.rowCount()):
-                name_item = self.topics_table.item(row, 1)
-                if name_item:
-                    topic_name = name_item.text()
-                    if topic_name in hz_dict:
-                        hz_value = hz_dict[topic_name]
-                        hz_text = f"{hz_value:.1f}"
-                        hz_item = self.topics_table.item(row, 4)
-                        if hz_item and hz_item.text() != hz_text:
-                            hz_item.setText(hz_text)
-        finally:
-            self.topics_table.setUpdatesEnabled(True)
-            
-    def on_topic_selected(self, topic_name, state):
-        """Handle topic selection change"""
-        if state == Qt.Checked:
+        """Update Hz column with fetched values (GUI thread, via _hz_fetched)"""
+        self.topics_model.set_hz(hz_dict)
+    
+    def on_topic_selected(self, topic_name, checked):
+        """Handle topic selection change (checked: bool or Qt.CheckState)"""
+        checked = checked == Qt.Checked or checked is True
+        if checked:
             self.selected_topics.add(topic_name)
         else:
             self.selected_topics.discard(topic_name)
-        self.topic_selected.emit(topic_name, state == Qt.Checked)
+        self.topic_selected.emit(topic_name, checked)
         # Debounce emitting the full selected-topics list to avoid flooding callers
         self._topics_changed_timer.start(50)
         
     def select_all_topics(self):
         """Select all topics for recording"""
         # Build selected set and update UI in batch without repeated signals
-        topics = []
-        for row in range(self.topics_table.rowCount()):
-            name_item = self.topics_table.item(row, 1)
-            if name_item:
-                topics.append(name_item.text())
-
-        self.selected_topics = set(topics)
-
-        # Update checkbox widgets visually without emitting stateChanged
-        for row in range(self.topics_table.rowCount()):
-            checkbox_widget = self.topics_table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox:
-                    checkbox.blockSignals(True)
-                    checkbox.setChecked(True)
-                    checkbox.blockSignals(False)
+        self.selected_topics = set(self.topics_model.names)
+        self.topics_model.refresh_check_states()
 
         # Emit single consolidated change
         self.topics_changed.emit(list(self.selected_topics))
@@ -295,15 +444,7 @@ class TopicMonitorWidget(QWidget):
     def deselect_all_topics(self):
         """Deselect all topics"""
         self.selected_topics.clear()
-
-        for row in range(self.topics_table.rowCount()):
-            checkbox_widget = self.topics_table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox:
-                    checkbox.blockSignals(True)
-                    checkbox.setChecked(False)
-                    checkbox.blockSignals(False)
+        self.topics_model.refresh_check_states()
 
         # Emit single consolidated change
         self.topics_changed.emit([])
@@ -319,137 +460,26 @@ class TopicMonitorWidget(QWidget):
     def set_selected_topics(self, topics):
         """Set selected topics from a list"""
         self.selected_topics = set(topics)
+        self.topics_model.refresh_check_states()  # Rows may be unchanged - repaint Record
         self.refresh_topics()
         
     def clear_selection(self):
         """Clear all topic selections"""
         self.selected_topics.clear()
+        self.topics_model.refresh_check_states()  # Rows may be unchanged - repaint Record
         self.refresh_topics()
     
     def update_topics_data(self, topics_info):
         """
-        Update topics from async data - ULTRA-OPTIMIZED INCREMENTAL UPDATE.
+        Update topics from async data.
         This method is called from background thread with pre-fetched data.
         
-        CRITICAL OPTIMIZATION: Reuse existing widgets instead of recreating them.
-        This eliminates the freeze caused by creating hundreds of checkboxes.
+        The model diffs against its current rows, so an unchanged topic list costs
+        no view notifications at all.
         """
         try:
-            # Disable updates during batch operation (MASSIVE performance gain)
-            self.topics_table.setUpdatesEnabled(False)
-            
-            # Build lookup of existing topics by row
-            existing_topics = {}
-            for row in range(self.topics_table.rowCount()):
-                name_item = self.topics_table.item(row, 1)
-                if name_item:
-                    existing_topics[name_item.text()] = row
-            
-            # Build new topics lookup
-            new_topics = {t['name']: t for t in topics_info}
-            
-            # Only resize if row count changed significantly (avoid flicker)
-            if abs(len(topics_info) - self.topics_table.rowCount()) > 0:
-                self.topics_table.setRowCount(len(topics_info))
-            
             self.topic_count_label.setText(f"Topics: {len(topics_info)}")
-            
-            for idx, topic_info in enumerate(topics_info):
-                topic_name = topic_info['name']
-                
-                # REUSE existing checkbox if topic already exists at same position
-                existing_row = existing_topics.get(topic_name, -1)
-                checkbox_widget = self.topics_table.cellWidget(idx, 0)
-                
-                if checkbox_widget is None or existing_row != idx:
-                    # Create NEW checkbox only if needed
-                    checkbox = QCheckBox()
-                    checkbox.setChecked(topic_name in self.selected_topics)
-                    checkbox.stateChanged.connect(
-                        lambda state, name=topic_name: self.on_topic_selected(name, state)
-                    )
-                    
-                    checkbox_widget = QWidget()
-                    checkbox_layout = QHBoxLayout(checkbox_widget)
-                    checkbox_layout.addWidget(checkbox)
-                    checkbox_layout.setAlignment(Qt.AlignCenter)
-                    checkbox_layout.setContentsMargins(0, 0, 0, 0)
-                    
-                    self.topics_table.setCellWidget(idx, 0, checkbox_widget)
-                else:
-                    # REUSE existing checkbox - just update checked state
-                    checkbox = checkbox_widget.findChild(QCheckBox)
-                    if checkbox:
-                        # Block signals to prevent triggering on_topic_selected
-                        checkbox.blockSignals(True)
-                        checkbox.setChecked(topic_name in self.selected_topics)
-                        checkbox.blockSignals(False)
-                
-                # Update or create topic name (cheap operation)
-                name_item = self.topics_table.item(idx, 1)
-                if name_item is None:
-                    name_item = QTableWidgetItem(topic_name)
-                    self.topics_table.setItem(idx, 1, name_item)
-                elif name_item.text() != topic_name:
-                    name_item.setText(topic_name)
-                
-                # Update or create message type
-                msg_type = topic_info.get('type', 'Unknown')
-                msg_type_item = self.topics_table.item(idx, 2)
-                if msg_type_item is None:
-                    msg_type_item = QTableWidgetItem(msg_type)
-                    self.topics_table.setItem(idx, 2, msg_type_item)
-                elif msg_type_item.text() != msg_type:
-                    msg_type_item.setText(msg_type)
-                
-                # Update or create publisher count
-                pub_count = topic_info.get('publisher_count', 0)
-                pub_item = self.topics_table.item(idx, 3)
-                if pub_item is None:
-                    pub_item = QTableWidgetItem(str(pub_count))
-                    pub_item.setTextAlignment(Qt.AlignCenter)
-                    self.topics_table.setItem(idx, 3, pub_item)
-                else:
-                    pub_item.setText(str(pub_count))
-                
-                # Color code based on publisher count
-                if pub_count > 0:
-                    pub_item.setForeground(QColor('green'))
-                else:
-                    pub_item.setForeground(QColor('gray'))
-                
-                # Update or create frequency
-                hz = topic_info.get('hz', 0.0)
-                hz_text = f"{hz:.1f}"
-                hz_item = self.topics_table.item(idx, 4)
-                if hz_item is None:
-                    hz_item = QTableWidgetItem(hz_text)
-                    hz_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    self.topics_table.setItem(idx, 4, hz_item)
-                elif hz_item.text() != hz_text:
-                    hz_item.setText(hz_text)
-                
-                # NEW: Update or create status column
-                pub_count = topic_info.get('publisher_count', 0)
-                status_text = "Publishing" if pub_count > 0 else "Idle"
-                status_color = QColor('green') if pub_count > 0 else QColor('orange')
-                
-                status_item = self.topics_table.item(idx, 5)
-                if status_item is None:
-                    status_item = QTableWidgetItem(status_text)
-                    status_item.setTextAlignment(Qt.AlignCenter)
-                    self.topics_table.setItem(idx, 5, status_item)
-                else:
-                    status_item.setText(status_text)
-                
-                status_item.setForeground(status_color)
-            
-            # Re-enable updates and force single repaint (instead of incremental)
-            self.topics_table.setUpdatesEnabled(True)
-            self.topics_table.repaint()  # Immediate repaint for smooth scrolling
-            
+            self.topics_model.set_topics(topics_info)
         except Exception as e:
             print(f"Error updating topics data: {e}")
             self.topic_count_label.setText(f"Topics: 0 (Error)")
-            self.topics_table.setUpdatesEnabled(True)  # Ensure updates re-enabled
-
@@ -25,7 +25,12 @@ import hashlib
 import json
 import gzip
 import shutil
+import sqlite3
 import ssl
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, Tuple, Optional
 import logging
@@ -46,7 +51,9 @@ if LIMITER_AVAILABLE:
         app=app,
         key_func=get_remote_address,
         default_limits=["200 per day", "50 per hour"],
-        storage_uri="memory://"
+        # memory:// counts per process - with several gunicorn workers every limit is
+        # multiplied by the worker count. Point this at shared storage (redis://...) instead.
+        storage_uri=os.environ.get('RATELIMIT_STORAGE_URI', 'memory://')
     )
 else:
     # Dummy decorator when limiter not available
@@ -68,8 +75,25 @@ os.makedirs(TEMP_DIR, exist_ok=True)
 os.makedirs(COMPLETED_DIR, exist_ok=True)
 os.makedirs(COMPRESSED_DIR, exist_ok=True)
 
-# In-memory storage for upload sessions
-upload_sessions: Dict[str, Dict[str, Any]] = {}
+# Upload sessions live in SQLite (WAL) rather than process memory, so they survive restarts
+# and every gunicorn worker sees the same chunk bitmap.
+SESSIONS_DB = os.path.join(UPLOAD_DIR, "sessions.db")
+
+# Abandoned sessions (init without finalize) are swept with their temp files
+SESSION_TTL = 60 * 60  # Seconds without a chunk before a session is abandoned
+SESSION_MAX = 1024  # Least recently active sessions beyond this are evicted
+SESSION_SWEEP_INTERVAL = 5 * 60  # Sweep on a timer so eviction doesn't depend on traffic
+
+# Parsed .metadata.json sidecars for /uploads, keyed by path -> (st_mtime_ns, metadata).
+# LRU-bounded; sized above a typical listing so one /uploads scan does not evict itself.
+METADATA_CACHE_MAX = 1024
+_metadata_cache: 'OrderedDict[str, Tuple[int, Dict[str, Any]]]' = OrderedDict()
+_metadata_cache_lock = threading.Lock()
+
+# Last /uploads response, reused while COMPLETED_DIR's mtime is unchanged.
+# Finalize bumps the generation so an in-place overwrite (same name, no dir change) is seen too.
+_uploads_listing: Optional[Tuple[int, int, list]] = None  # (generation, dir st_mtime_ns, uploads)
+_uploads_generation = 0
 
 # Compression settings
 COMPRESSION_THRESHOLD = 10 * 1024 * 1024  # Compress files > 10MB
@@ -83,7 +107,7 @@ def health_check() -> Tuple[Any, int]:
         'status': 'ok',
         'timestamp': datetime.now().isoformat(),
         'version': '2.0-production',
-        'features': ['chunked-upload', 'compression', 'rate-limiting', 'ssl-support']
+        'features': ['chunked-upload', 'compression', 'rate-limiting', 'ssl-support', 'raw-chunks']
     }), 200
 
 
@@ -102,6 +126,7 @@ def initialize_upload() -> Tuple[Any, int]:
         metadata: Dict[str, Any] = data.get('metadata', {})
         checksum: Optional[str] = data.get('checksum')
         compression: bool = data.get('compression', False)
+        chunk_size: Optional[int] = data.get('chunk_size')
 
         # Validate required fields
         if not filename or filesize is None or chunks is None:
@@ -121,32 +146,42 @@ def initialize_upload() -> Tuple[Any, int]:
         # Generate upload ID
         upload_id = str(uuid.uuid4())
 
+        # Clients that send chunk_size get direct writes into one preallocated file;
+        # older clients fall back to per-chunk temp files concatenated at finalize
+        direct = isinstance(chunk_size, int) and chunk_size > 0 and chunks * chunk_size >= filesize
+
         # Create session
-        upload_sessions[upload_id] = {
+        session = {
             'filename': filename,
             'filesize': filesize,
             'chunks': chunks,
+            'chunk_size': chunk_size if direct else None,
             'metadata': metadata,
             'checksum': checksum,
             'compression': compression and filesize >= COMPRESSION_THRESHOLD,
-            'received_chunks': set(),
             'created_at': datetime.now().isoformat(),
-            'temp_dir': os.path.join(TEMP_DIR, upload_id)
+            'temp_dir': os.path.join(TEMP_DIR, upload_id),
+            'part_path': os.path.join(TEMP_DIR, f'{upload_id}.part')
         }
 
-        # Create temp directory for chunks
-        os.makedirs(upload_sessions[upload_id]['temp_dir'], exist_ok=True)
+        if direct:
+            _preallocate(session['part_path'], filesize)
+        else:
+            # Create temp directory for chunks
+            os.makedirs(session['temp_dir'], exist_ok=True)
+
+        _create_session(upload_id, session)
 
         logger.info(
             f"Initialized upload: {filename} ({filesize} bytes, {chunks} chunks) "
-            f"- ID: {upload_id} - Compression: {upload_sessions[upload_id]['compression']}"
+            f"- ID: {upload_id} - Compression: {session['compression']}"
         )
 
         return jsonify({
             'success': True,
             'upload_id': upload_id,
             'message': 'Upload session created',
-            'compression_enabled': upload_sessions[upload_id]['compression']
+            'compression_enabled': session['compression']
         }), 200
 
     except Exception as e:
@@ -157,11 +192,14 @@ def initialize_upload() -> Tuple[Any, int]:
 @app.route('/upload/chunk', methods=['POST'])
 @limiter.limit("100 per minute")
 def upload_chunk() -> Tuple[Any, int]:
-    """Upload a single chunk"""
+    """Upload a single chunk (multipart form, or a raw octet-stream body with query fields)"""
     try:
-        upload_id: Optional[str] = request.form.get('upload_id')
-        chunk_index_str: Optional[str] = request.form.get('chunk_index')
-        chunk_total_str: Optional[str] = request.form.get('chunk_total')
+        # Raw bodies are read straight off the socket; multipart is spooled by werkzeug first
+        raw = request.mimetype == 'application/octet-stream'
+        fields = request.args if raw else request.form
+        upload_id: Optional[str] = fields.get('upload_id')
+        chunk_index_str: Optional[str] = fields.get('chunk_index')
+        chunk_total_str: Optional[str] = fields.get('chunk_total')
 
         # Validate required fields
         if not upload_id or not chunk_index_str or not chunk_total_str:
@@ -179,31 +217,37 @@ def upload_chunk() -> Tuple[Any, int]:
                 'error': 'Invalid chunk_index or chunk_total (must be integers)'
             }), 400
 
-        if upload_id not in upload_sessions:
+        session = _get_session(upload_id)
+        if session is None:
             return jsonify({'success': False, 'error': 'Invalid upload ID'}), 400
 
-        session = upload_sessions[upload_id]
-
         # Get chunk data
-        chunk_file = request.files.get('chunk')
-        if not chunk_file:
+        chunk_file = None if raw else request.files.get('chunk')
+        if not raw and not chunk_file:
             return jsonify({'success': False, 'error': 'No chunk data provided'}), 400
+        stream = request.stream if raw else chunk_file.stream
+
+        if not 0 <= chunk_index < session['chunks']:
+            return jsonify({'success': False, 'error': 'chunk_index out of range'}), 400
 
         # Save chunk
-        chunk_path = os.path.join(session['temp_dir'], f'chunk_{chunk_index}')
-        chunk_file.save(chunk_path)
+        if session['chunk_size']:
+            _write_chunk_at(session, chunk_index, stream)
+        else:
+            with open(_chunk_path(session, chunk_index), 'wb') as f:
+                shutil.copyfileobj(stream, f, 1024 * 1024)
 
-        # Mark chunk as received
-        session['received_chunks'].add(chunk_index)
+        # Mark chunk as received - retried chunks are only counted once
+        received = _mark_chunk_received(upload_id, chunk_index)
 
-        progress = len(session['received_chunks']) / chunk_total * 100
+        progress = received / chunk_total * 100
         logger.info(
             f"Received chunk {chunk_index + 1}/{chunk_total} for {session['filename']} ({progress:.1f}%)"
         )
 
         return jsonify({
             'success': True,
-            'received_chunks': len(session['received_chunks']),
+            'received_chunks': received,
             'total_chunks': chunk_total,
             'progress': progress
         }), 200
@@ -228,38 +272,53 @@ def finalize_upload() -> Tuple[Any, int]:
         if not upload_id:
             return jsonify({'success': False, 'error': 'Missing upload_id'}), 400
 
-        if upload_id not in upload_sessions:
+        session = _get_session(upload_id)
+        if session is None:
             return jsonify({'success': False, 'error': 'Invalid upload ID'}), 400
 
-        session = upload_sessions[upload_id]
-
         # Verify all chunks received
-        if len(session['received_chunks']) != session['chunks']:
-            missing = session['chunks'] - len(session['received_chunks'])
+        if session['received_count'] != session['chunks']:
+            missing = session['chunks'] - session['received_count']
             return jsonify({
                 'success': False,
-                'error': f"Missing {missing} chunk(s): {len(session['received_chunks'])}/{session['chunks']}"
+                'error': f"Missing {missing} chunk(s): {session['received_count']}/{session['chunks']}"
             }), 400
 
         # Combine chunks
         output_path = os.path.join(COMPLETED_DIR, session['filename'])
-
-        with open(output_path, 'wb') as output_file:
-            for i in range(session['chunks']):
-                chunk_path = os.path.join(session['temp_dir'], f'chunk_{i}')
-                with open(chunk_path, 'rb') as chunk_file:
-                    output_file.write(chunk_file.read())
-
-        # Verify checksum
-        calculated_checksum = calculate_checksum(output_path)
-
-        if checksum and calculated_checksum != checksum:
-            os.remove(output_path)
-            logger.warning(f"Checksum mismatch for {session['filename']}")
-            return jsonify({
-                'success': False,
-                'error': f'Checksum mismatch (expected: {checksum}, got: {calculated_checksum})'
-            }), 400
+        _invalidate_uploads_listing()
+
+        if session['chunk_size']:
+            # Chunks were written in place - verify the part file, then publish it with a rename
+            calculated_checksum = calculate_checksum(session['part_path'])
+            if checksum and calculated_checksum != checksum:
+                # The in-place data is bad and there are no chunk files to rebuild from:
+                # drop the session and answer 409 + restart so the client re-inits and resends
+                os.remove(session['part_path'])
+                _delete_session(upload_id)
+                logger.warning(f"Checksum mismatch for {session['filename']} - upload must restart")
+                return jsonify({
+                    'success': False,
+                    'error': f'Checksum mismatch (expected: {checksum}, got: {calculated_checksum})',
+                    'restart': True
+                }), 409
+            os.replace(session['part_path'], output_path)
+        else:
+            with open(output_path, 'wb') as output_file:
+                for i in range(session['chunks']):
+                    with open(_chunk_path(session, i), 'rb') as chunk_file:
+                        _copy_file_into(chunk_file, output_file)
+
+            # Verify checksum
+            calculated_checksum = calculate_checksum(output_path)
+
+            if checksum and calculated_checksum != checksum:
+                os.remove(output_path)
+                logger.warning(f"Checksum mismatch for {session['filename']}")
+                return jsonify({
+                    'success': False,
+                    'error': f'Checksum mismatch (expected: {checksum}, got: {calculated_checksum})'
+                }), 400
 
         # Handle compression if needed
         compression_applied = False
@@ -286,19 +345,15 @@ def finalize_upload() -> Tuple[Any, int]:
             except Exception as e:
                 logger.warning(f"Compression failed for {session['filename']}: {e}")
 
-        # Clean up temp files
-        for i in range(session['chunks']):
-            chunk_path = os.path.join(session['temp_dir'], f'chunk_{i}')
-            if os.path.exists(chunk_path):
-                os.remove(chunk_path)
-        try:
-            os.rmdir(session['temp_dir'])
-        except OSError:
-            pass
+        # Clean up temp files - one tree removal instead of exists()+remove() per chunk
+        shutil.rmtree(session['temp_dir'], ignore_errors=True)
 
-        # Save metadata
+        # Save metadata - write aside then rename so /uploads never reads a half-written sidecar
         metadata_path = output_path + '.metadata.json'
-        with open(metadata_path, 'w') as f:
+        metadata_tmp_path = os.path.join(TEMP_DIR, f'{upload_id}.metadata.json.tmp')
+        with _metadata_cache_lock:
+            _metadata_cache.pop(metadata_path, None)
+        with open(metadata_tmp_path, 'w') as f:
             json.dump({
                 'filename': session['filename'],
                 'filesize': session['filesize'],
@@ -309,11 +364,13 @@ def finalize_upload() -> Tuple[Any, int]:
                 'compressed_path': compressed_path,
                 'uploaded_at': datetime.now().isoformat()
             }, f, indent=2)
+        os.replace(metadata_tmp_path, metadata_path)
 
+        _invalidate_uploads_listing()
         logger.info(f"Upload completed: {session['filename']} → {output_path}")
 
         # Remove session
-        del upload_sessions[upload_id]
+        _delete_session(upload_id)
 
         return jsonify({
             'success': True,
@@ -332,17 +389,16 @@ def finalize_upload() -> Tuple[Any, int]:
 @app.route('/upload/status/<upload_id>', methods=['GET'])
 def upload_status(upload_id: str) -> Tuple[Any, int]:
     """Get upload status"""
-    if upload_id not in upload_sessions:
+    session = _get_session(upload_id)
+    if session is None:
         return jsonify({'success': False, 'error': 'Invalid upload ID'}), 404
 
-    session = upload_sessions[upload_id]
-
     return jsonify({
         'success': True,
         'filename': session['filename'],
-        'received_chunks': len(session['received_chunks']),
+        'received_chunks': session['received_count'],
         'total_chunks': session['chunks'],
-        'progress': len(session['received_chunks']) / session['chunks'] * 100,
+        'progress': session['received_count'] / session['chunks'] * 100,
         'compression_enabled': session['compression']
     }), 200
 
@@ -351,37 +407,301 @@ def upload_status(upload_id: str) -> Tuple[Any, int]:
 @limiter.limit("30 per minute")
 def list_uploads() -> Tuple[Any, int]:
     """List completed uploads"""
-    uploads = []
+    global _uploads_listing
 
-    for filename in os.listdir(COMPLETED_DIR):
-        if filename.endswith('.metadata.json'):
-            continue
+    # Nothing added, removed or finalized since the last scan - reuse it
+    generation = _uploads_generation
+    dir_mtime_ns = os.stat(COMPLETED_DIR).st_mtime_ns
+    cached = _uploads_listing
+    if cached and cached[0] == generation and cached[1] == dir_mtime_ns:
+        return jsonify({'success': True, 'uploads': cached[2]}), 200
 
-        filepath = os.path.join(COMPLETED_DIR, filename)
-        metadata_path = filepath + '.metadata.json'
-
-        upload_info = {
-            'filename': filename,
-            'size': os.path.getsize(filepath),
-            'uploaded_at': datetime.fromtimestamp(os.path.getmtime(filepath)).isoformat()
-        }
+    uploads = []
 
-        if os.path.exists(metadata_path):
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
+    # scandir: name, type and one stat per entry instead of getsize + getmtime
+    with os.scandir(COMPLETED_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith('.metadata.json') or not entry.is_file():
+                continue
+
+            st = entry.stat()
+            upload_info = {
+                'filename': entry.name,
+                'size': st.st_size,
+                'uploaded_at': datetime.fromtimestamp(st.st_mtime).isoformat()
+            }
+
+            metadata = _load_upload_metadata(entry.path + '.metadata.json')
+            if metadata:
                 upload_info.update(metadata)
 
-        uploads.append(upload_info)
+            uploads.append(upload_info)
 
+    _uploads_listing = (generation, dir_mtime_ns, uploads)
     return jsonify({'success': True, 'uploads': uploads}), 200
 
 
+def _sessions_db() -> sqlite3.Connection:
+    """Open a connection to the shared session store"""
+    conn = sqlite3.connect(SESSIONS_DB, timeout=30)
+    conn.execute('PRAGMA synchronous=NORMAL')  # Safe with WAL; skips an fsync per chunk
+    return conn
+
+
+def _init_sessions_db() -> None:
+    """Create the session table (WAL mode is persistent, so it is set once here)"""
+    conn = _sessions_db()
+    try:
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS upload_sessions (
+                upload_id TEXT PRIMARY KEY,
+                session TEXT NOT NULL,
+                received_bitmap BLOB NOT NULL,
+                received_count INTEGER NOT NULL DEFAULT 0,
+                last_active REAL NOT NULL DEFAULT 0
+            )
+        ''')
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _create_session(upload_id: str, session: Dict[str, Any]) -> None:
+    conn = _sessions_db()
+    try:
+        with conn:
+            conn.execute(
+                'INSERT INTO upload_sessions (upload_id, session, received_bitmap, last_active) '
+                'VALUES (?, ?, ?, ?)',
+                (upload_id, json.dumps(session), bytes((session['chunks'] + 7) // 8),  # One bit per chunk
+                 time.time())
+            )
+    finally:
+        conn.close()
+
+
+def _get_session(upload_id: str) -> Optional[Dict[str, Any]]:
+    conn = _sessions_db()
+    try:
+        row = conn.execute(
+            'SELECT session, received_count FROM upload_sessions WHERE upload_id = ?', (upload_id,)
+        ).fetchone()
+    finally:
+        conn.close()
+    if row is None:
+        return None
+    session = json.loads(row[0])
+    session['received_count'] = row[1]
+    return session
+
+
+def _mark_chunk_received(upload_id: str, index: int) -> int:
+    """Set the chunk's bit and return the received count; safe across threads and workers"""
+    conn = _sessions_db()
+    try:
+        conn.execute('BEGIN IMMEDIATE')  # Take the write lock before reading the bitmap
+        row = conn.execute(
+            'SELECT received_bitmap, received_count FROM upload_sessions WHERE upload_id = ?',
+            (upload_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f'Upload session {upload_id} no longer exists')
+        bitmap, received = row
+        bit = 1 << (index & 7)
+        if not bitmap[index >> 3] & bit:
+            bitmap = bytearray(bitmap)
+            bitmap[index >> 3] |= bit
+            received += 1
+        conn.execute(
+            'UPDATE upload_sessions SET received_bitmap = ?, received_count = ?, last_active = ? '
+            'WHERE upload_id = ?',
+            (bytes(bitmap), received, time.time(), upload_id)
+        )
+        conn.commit()
+        return received
+    finally:
+        conn.close()
+
+
+def _delete_session(upload_id: str) -> None:
+    conn = _sessions_db()
+    try:
+        with conn:
+            conn.execute('DELETE FROM upload_sessions WHERE upload_id = ?', (upload_id,))
+    finally:
+        conn.close()
+
+
+def _expire_sessions() -> int:
+    """Drop sessions idle past SESSION_TTL or beyond SESSION_MAX, removing their temp files"""
+    conn = _sessions_db()
+    try:
+        with conn:
+            rows = conn.execute(
+                'SELECT upload_id, session FROM upload_sessions WHERE last_active < ? '
+                'UNION SELECT upload_id, session FROM ('
+                '    SELECT upload_id, session FROM upload_sessions'
+                '    ORDER BY last_active DESC LIMIT -1 OFFSET ?)',
+                (time.time() - SESSION_TTL, SESSION_MAX)
+            ).fetchall()
+            conn.executemany('DELETE FROM upload_sessions WHERE upload_id = ?',
+                             [(upload_id,) for upload_id, _ in rows])
+    finally:
+        conn.close()
+
+    for upload_id, session_json in rows:
+        session = json.loads(session_json)
+        shutil.rmtree(session['temp_dir'], ignore_errors=True)
+        try:
+            os.remove(session['part_path'])
+        except FileNotFoundError:
+            pass
+        logger.info(f"Expired abandoned upload session {upload_id} ({session['filename']})")
+    return len(rows)
+
+
+def _schedule_session_sweep() -> None:
+    """Run _expire_sessions every SESSION_SWEEP_INTERVAL on a daemon timer"""
+    def sweep():
+        try:
+            _expire_sessions()
+        except Exception as e:
+            logger.error(f"Error expiring upload sessions: {e}")
+        _schedule_session_sweep()
+
+    timer = threading.Timer(SESSION_SWEEP_INTERVAL, sweep)
+    timer.daemon = True
+    timer.start()
+
+
+def _invalidate_uploads_listing() -> None:
+    """Force the next /uploads request to rescan COMPLETED_DIR"""
+    global _uploads_listing, _uploads_generation
+    _uploads_generation += 1
+    _uploads_listing = None
+
+
+def _chunk_path(session: Dict[str, Any], index: int) -> str:
+    """Temp file path for one received chunk of an upload session"""
+    return os.path.join(session['temp_dir'], f'chunk_{index}')
+
+
+def _preallocate(path: str, size: int) -> None:
+    """Create the destination file at its final size so chunks can be written at their offsets"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.ftruncate(fd, size)
+        if size and hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(fd, 0, size)  # Reserve real blocks up front (less fragmentation)
+            except OSError:
+                pass  # Not supported on this filesystem - the sparse file still works
+    finally:
+        os.close(fd)
+
+
+def _write_chunk_at(session: Dict[str, Any], index: int, stream) -> None:
+    """pwrite one chunk's request body straight into the preallocated file"""
+    offset = index * session['chunk_size']
+    end = min(offset + session['chunk_size'], session['filesize'])
+    fd = os.open(session['part_path'], os.O_WRONLY)
+    try:
+        while offset < end:
+            data = stream.read(min(1024 * 1024, end - offset))
+            if not data:
+                break
+            os.pwrite(fd, data, offset)
+            offset += len(data)
+    finally:
+        os.close(fd)
+    if offset != end:
+        raise ValueError(f'Chunk {index} is {end - offset} bytes short')
+
+
+def _copy_file_into(src, dst) -> None:
+    """Append src to dst - in-kernel via sendfile where supported, else 1 MiB buffered copy"""
+    if hasattr(os, 'sendfile'):
+        size = os.fstat(src.fileno()).st_size
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except OSError:
+            # Filesystem without sendfile-to-file support - finish with a buffered copy
+            src.seek(offset)
+    shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def _load_upload_metadata(metadata_path: str) -> Optional[Dict[str, Any]]:
+    """Parse an upload's metadata sidecar, reusing the cached dict while the file is unchanged"""
+    try:
+        mtime_ns = os.stat(metadata_path).st_mtime_ns
+    except FileNotFoundError:
+        with _metadata_cache_lock:
+            _metadata_cache.pop(metadata_path, None)
+        return None
+
+    with _metadata_cache_lock:
+        cached = _metadata_cache.get(metadata_path)
+        if cached and cached[0] == mtime_ns:
+            _metadata_cache.move_to_end(metadata_path)
+            return cached[1]
+
+    with open(metadata_path, 'r') as f:
+        metadata = json.load(f)
+
+    with _metadata_cache_lock:
+        _metadata_cache[metadata_path] = (mtime_ns, metadata)
+        _metadata_cache.move_to_end(metadata_path)
+        while len(_metadata_cache) > METADATA_CACHE_MAX:
+            _metadata_cache.popitem(last=False)
+    return metadata
+
+
+HASH_BUFFER_SIZE = 1024 * 1024  # 1 MiB reads - 8 KiB reads spend more time in Python than in MD5
+
+
+# Large finalized uploads have usually left the page cache, so their hash is disk-bound
+HASH_PREFETCH_THRESHOLD = 64 * 1024 * 1024
+
+
 def calculate_checksum(file_path: str) -> str:
-    """Calculate MD5 checksum"""
+    """Calculate MD5 checksum (MD5 is what the dashboard client sends)"""
+    with open(file_path, 'rb', buffering=0) as f:
+        if os.fstat(f.fileno()).st_size >= HASH_PREFETCH_THRESHOLD:
+            return _md5_prefetched(f)
+
+        # Python 3.11+: hashing loop runs in C with a reusable buffer
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'md5').hexdigest()
+
+        md5 = hashlib.md5()
+        buf = bytearray(HASH_BUFFER_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            md5.update(view[:n])
+    return md5.hexdigest()
+
+
+def _md5_prefetched(f) -> str:
+    """MD5 while the next block is read on a helper thread - read and hash both drop the GIL"""
     md5 = hashlib.md5()
-    with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
-            md5.update(chunk)
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        pending = reader.submit(f.read, HASH_BUFFER_SIZE)
+        while True:
+            block = pending.result()
+            if not block:
+                break
+            pending = reader.submit(f.read, HASH_BUFFER_SIZE)  # Disk works on block n+1...
+            md5.update(block)  # ...while this thread hashes block n
     return md5.hexdigest()
 
 
@@ -413,6 +733,10 @@ def setup_ssl(cert_file: Optional[str] = None, key_file: Optional[str] = None) -
         return None
 
 
+_init_sessions_db()
+_schedule_session_sweep()
+
+
 if __name__ == '__main__':
     print(f"""
 ╔═══════════════════════════════════════════════════════════╗
@@ -431,6 +755,10 @@ if __name__ == '__main__':
 ║    SSL_KEY=/path/to/key.pem                              ║
 ║                                                           ║
 ║  HTTP:  python3 upload_server.py                         ║
+║  WSGI:  gunicorn -w 4 --threads 4 --timeout 0 \\         ║
+║         -b 0.0.0.0:8080 upload_server:app                ║
+║  With -w > 1, share rate limits across workers:          ║
+║    RATELIMIT_STORAGE_URI=redis://localhost:6379          ║
 ║  HTTPS: SSL_CERT=cert.pem SSL_KEY=key.pem \\              ║
 ║         python3 upload_server.py                         ║
 ╚═══════════════════════════════════════════════════════════╝
@@ -444,7 +772,7 @@ if __name__ == '__main__':
     # Run server with optional SSL
     if ssl_context:
         logger.info("Starting server with SSL/TLS enabled (HTTPS)")
-        app.run(host='0.0.0.0', port=8080, debug=False, ssl_context=ssl_context)
+        app.run(host='0.0.0.0', port=8080, debug=False, threaded=True, ssl_context=ssl_context)
     else:
         logger.info("Starting server without SSL (HTTP)")
-        app.run(host='0.0.0.0', port=8080, debug=False)
+        app.run(host='0.0.0.0', port=8080, debug=False, threaded=True)